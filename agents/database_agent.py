@@ -501,6 +501,35 @@ class DatabaseAgent:
             logger.error(f"❌ Error updating prospect {prospect_id}: {e}")
             raise DatabaseError(f"Failed to update prospect: {e}") from e
 
+    def update_prospects(self, updates_by_id: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Update several prospects in one call.
+
+        Runs update_prospect() for each prospect, so the ``prospect_id`` fallback
+        applies and a prospect that is found but unchanged still counts.
+
+        Args:
+            updates_by_id: Prospect ID (stored LinkedIn URL) -> fields to update
+
+        Returns:
+            Number of prospects found
+
+        Example:
+            >>> found = agent.update_prospects({
+            ...     "https://linkedin.com/in/johndoe": {"enrichment_status": "success"},
+            ...     "https://linkedin.com/in/janesmith": {"enrichment_status": "failed"}
+            ... })
+        """
+        if not isinstance(updates_by_id, dict):
+            raise ValidationError(f"Updates must be dict, got {type(updates_by_id)}")
+
+        found = sum(
+            1 for prospect_id, updates in updates_by_id.items()
+            if self.update_prospect(prospect_id, updates) is not None
+        )
+        logger.info(f"✅ Updated {found}/{len(updates_by_id)} prospects")
+        return found
+
 
 # ============================================================================
 # LEGACY COMPATIBILITY
@@ -747,7 +747,8 @@ class UnifiedSourcingManager:
             "enrichment_config": {
                 "batch_size": 10,
                 "rate_limit_delay": 1,
-                "max_retries": 3
+                "max_retries": 3,
+                "copy_candidates": False  # payload dicts above are built per request
             }
         }
 
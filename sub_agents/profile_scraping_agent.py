@@ -10,19 +10,523 @@ information to maintain data accuracy and relevance. Updates will be stored by t
 """
 
 #  ---- Package imports ----
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+import asyncio
 import logging
 import json
 import os
+import re
+import functools
+import itertools
+import random
+import sys
 from datetime import datetime
 import time
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from urllib.parse import urlsplit
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 #  ---- Local imports ----
 from tools.scourcing_tools import LinkedIn_profile_scrape
 
+try:
+    from agents.database_agent import DatabaseAgent, DatabaseAgentState
+except ImportError as e:
+    # Enrichment still works without persistence; updates report 0 rows
+    DatabaseAgent = DatabaseAgentState = None
+    _database_agent_import_error = e
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Parser for scrape payloads; orjson is considerably faster on large profiles
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+
+
+# Profile fields copied onto the candidate whenever the scrape returns them
+_MERGE_KEYS = (
+    "work_experience",
+    "education",
+    "certifications",
+    "languages",
+    "endorsements",
+    "connections_count",
+)
+
+# Profile fields (source key, candidate key) that only overwrite when non-empty
+_NON_EMPTY_MERGE_KEYS = (
+    ("summary", "profile_summary"),
+    ("headline", "headline"),
+)
+
+# Enriched candidate fields written back to the prospect document
+_PROSPECT_UPDATE_KEYS = (
+    "work_experience",
+    "education",
+    "skills",
+    "certifications",
+    "languages",
+    "endorsements",
+    "profile_summary",
+    "headline",
+    "connections_count",
+)
+
+# Scrape errors that will not resolve on retry (unlike 429s or timeouts)
+_PERMANENT_ERROR_MARKERS = (
+    "404",
+    "not found",
+    "profile_removed",
+    "removed",
+    "private",
+    "not accessible",
+    "does not exist",
+)
+
+
+# Upper bound for a single retry wait (seconds)
+_MAX_RETRY_DELAY = 60
+
+
+def _is_rate_limit_error(error_message: str) -> bool:
+    """Whether a scrape failure means LinkedIn is throttling us."""
+    error_message = error_message.lower()
+    return "429" in error_message or "rate limit" in error_message or "too many requests" in error_message
+
+
+# ISO dates/datetimes accepted by datetime.fromisoformat in work history entries
+_ISO_DATE_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?(?:Z|[+-]\d{2}:\d{2})?"
+)
+
+# Sentinel for "ends now" in vectorized duration calculation
+_CURRENT_MONTH = object()
+
+
+def _iso_month(value: Any) -> Optional[str]:
+    """The ``YYYY-MM-DD`` part of an ISO date string, or None if it is not one."""
+    if isinstance(value, str) and _ISO_DATE_PATTERN.fullmatch(value):
+        return value[:10]
+    return None
+
+
+# Plain YYYY-MM / YYYY-MM-DD dates, read without building a datetime
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})(?:-(\d{2}))?")
+
+
+def _year_month(value: Any) -> Tuple[int, int]:
+    """
+    ``(year, month)`` of a work-history date.
+    
+    Plain dates take a regex fast path (which also accepts month-precision
+    ``YYYY-MM``); other strings go through ``datetime.fromisoformat`` and
+    datetime objects are read directly. Raises ValueError if unparseable.
+    """
+    if isinstance(value, str):
+        match = _DATE_RE.fullmatch(value)
+        if match and 1 <= int(match[2]) <= 12 and (match[3] is None or 1 <= int(match[3]) <= 31):
+            return int(match[1]), int(match[2])
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.year, value.month
+
+
+def _numpy():
+    """numpy, imported on first use so loading the agent module stays cheap."""
+    import numpy
+    return numpy
+
+
+def _intern_skill(skill: Any) -> Any:
+    """Intern skill names so the same skill across candidates shares one string."""
+    return sys.intern(skill) if type(skill) is str else skill
+
+
+def _is_permanent_scrape_error(error_message: str) -> bool:
+    """Whether a scrape failure is stable enough to cache negatively."""
+    error_message = error_message.lower()
+    return any(marker in error_message for marker in _PERMANENT_ERROR_MARKERS)
+
+# Company context rules as (keywords, fields set on a match). Groups are checked
+# independently; within a group earlier rules take priority over later ones.
+_COMPANY_SIZE_RULES = (
+    (("startup", "early-stage", "early stage"), {"company_size": "Startup", "company_stage": "Early"}),
+    (("scale-up", "scaling", "hyper-growth", "growth stage"), {"company_size": "Growth", "company_stage": "Growth"}),
+    (("enterprise", "large", "multinational", "global"), {"company_size": "Large", "company_stage": "Mature"}),
+    (("mid-size", "mid size", "medium"), {"company_size": "Medium", "company_stage": "Established"}),
+)
+
+_INDUSTRY_RULES = (
+    (("fintech", "banking", "finance", "financial services", "investment"), {"industry": "Financial Services"}),
+    (("healthcare", "pharmaceutical", "biotech", "medical"), {"industry": "Healthcare/Biotech"}),
+    (("software", "technology", "tech", "saas", "cloud", "development"), {"industry": "Technology"}),
+    (("consulting", "advisory"), {"industry": "Consulting"}),
+    (("retail", "e-commerce", "ecommerce", "commerce"), {"industry": "Retail/E-commerce"}),
+    (("education", "university", "school"), {"industry": "Education"}),
+    (("manufacturing", "industrial", "production"), {"industry": "Manufacturing"}),
+    (("marketing", "agency", "advertising"), {"industry": "Marketing/Advertising"}),
+)
+
+_COMPANY_TYPE_RULES = (
+    (("b2b",), {"company_type": "B2B"}),
+    (("b2c",), {"company_type": "B2C"}),
+    (("b2g",), {"company_type": "B2G"}),
+)
+
+
+def _build_keyword_index(*rule_groups) -> Tuple[Dict[str, Tuple[int, int, Dict[str, str]]], "re.Pattern"]:
+    """
+    Index keyword -> (group, priority, fields) and compile one pattern matching them all.
+    
+    The pattern is a lookahead so overlapping keywords (e.g. "fintech" and "tech")
+    are all reported by a single ``finditer`` over the text.
+    """
+    index = {}
+    for group, rules in enumerate(rule_groups):
+        for priority, (keywords, values) in enumerate(rules):
+            for keyword in keywords:
+                index[keyword] = (group, priority, values)
+    
+    alternation = "|".join(re.escape(keyword) for keyword in sorted(index, key=len, reverse=True))
+    return index, re.compile(f"(?=({alternation}))")
+
+
+_COMPANY_KEYWORDS, _COMPANY_KEYWORD_PATTERN = _build_keyword_index(
+    _COMPANY_SIZE_RULES, _INDUSTRY_RULES, _COMPANY_TYPE_RULES
+)
+
+
+def _match_company_context(desc_lower: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Company context fields inferred from a lowercased description, as immutable (field, value) pairs.
+    
+    One pass over the text finds every keyword; within each group the
+    highest-priority rule wins.
+    """
+    best_rules = {}
+    for keyword in {match.group(1) for match in _COMPANY_KEYWORD_PATTERN.finditer(desc_lower)}:
+        group, priority, values = _COMPANY_KEYWORDS[keyword]
+        if group not in best_rules or priority < best_rules[group][0]:
+            best_rules[group] = (priority, values)
+    
+    return tuple(item for _, values in best_rules.values() for item in values.items())
+
+
+# Memoized variant for descriptions long enough to be worth caching
+_cached_company_context = functools.lru_cache(maxsize=50000)(_match_company_context)
+_CONTEXT_CACHE_MIN_LENGTH = 32
+
+
+def _lowered_descriptions(work_experience: List[Dict[str, Any]]) -> List[str]:
+    """Lowercase every position description once for all keyword passes."""
+    return [(position.get("description") or "").lower() for position in work_experience]
+
+
+# Position fields read by the deep analyses; only these go into the analysis cache key
+_ANALYSIS_POSITION_FIELDS = (
+    "title", "company", "description", "start_date", "end_date", "current", "duration_months"
+)
+
+
+def _analysis_cache_key(work_experience: List[Dict[str, Any]], skills: List[str]) -> Optional[tuple]:
+    """
+    Hashable snapshot of the inputs to the deep analyses, or None if a field isn't hashable.
+    
+    The tuple itself is the key, so lookups compare it exactly rather than trusting a digest.
+    Current positions are measured up to this month, so the month is part of the key.
+    """
+    key = (
+        datetime.now().strftime("%Y-%m"),
+        tuple(skills),
+        tuple(tuple(map(position.get, _ANALYSIS_POSITION_FIELDS)) for position in work_experience)
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Deep-analysis keyword categories as (label, keywords), in the order they are checked
+_COMPANY_TIER_KEYWORDS = (
+    ("STARTUP", ("startup", "early stage", "seed", "series a")),
+    ("SCALE_UP", ("scale-up", "growth", "series b", "series c")),
+    ("ENTERPRISE", ("enterprise", "fortune", "nasdaq", "s&p", "multinational")),
+)
+
+_INDUSTRY_FOCUS_KEYWORDS = (
+    ("TECHNOLOGY", ("tech", "software", "ai", "machine learning", "cloud", "devops")),
+    ("FINANCE", ("finance", "banking", "investment", "trading", "fintech")),
+    ("HEALTHCARE", ("healthcare", "medical", "pharma", "biotech")),
+    ("COMMERCE", ("e-commerce", "retail", "sales", "marketing")),
+)
+
+_ACHIEVEMENT_KEYWORDS = (
+    ("leadership_achievements", ("led", "managed", "mentored", "supervised", "directed", "oversaw", "pioneered", "spearheaded")),
+    ("technical_achievements", ("built", "designed", "architected", "implemented", "developed", "engineered", "optimized", "automated")),
+    ("business_impact", ("revenue", "growth", "cost savings", "efficiency", "market", "launch", "scale", "expand")),
+)
+
+# One shared flag string per achievement category
+_ACHIEVEMENT_FLAGS = {
+    "leadership_achievements": "Leadership/Management experience demonstrated",
+    "technical_achievements": "Technical delivery/innovation demonstrated",
+    "business_impact": "Business impact/commercial focus demonstrated",
+}
+
+# Quantified results ("25%", "$2M", "12 people"); non-capturing so findall returns whole matches.
+# Numbers only start at the beginning of a digit run, so long runs are scanned once instead of
+# retried from every digit (quadratic backtracking on e.g. IDs or phone numbers).
+_QUANT_RE = re.compile(
+    r'(?<!\d)\d+%|\$\d+[MK]?|(?<!\d)\d+\s*(?:projects?|teams?|people|users|customers)',
+    re.IGNORECASE
+)
+
+
+# Word tokens of lowercased text; keywords made of a single token are matched as whole words
+_TOKEN_RE = re.compile(r"[a-z0-9+#/]+")
+
+
+def _word_categories(
+    categories: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Tuple[Tuple[str, frozenset, Optional["re.Pattern"]], ...]:
+    """
+    Split each category into a whole-word token set and a pattern for its phrases.
+    
+    Phrases ("series a", "e-commerce") cannot be found in a token set, so they
+    get one boundary-anchored alternation per category.
+    """
+    compiled = []
+    for label, keywords in categories:
+        words = frozenset(keyword for keyword in keywords if _TOKEN_RE.fullmatch(keyword))
+        phrases = [re.escape(keyword) for keyword in keywords if keyword not in words]
+        pattern = re.compile(rf"(?<![a-z0-9])(?:{'|'.join(phrases)})(?![a-z0-9])") if phrases else None
+        compiled.append((label, words, pattern))
+    return tuple(compiled)
+
+
+def _first_word_category(
+    text: str,
+    tokens: frozenset,
+    categories: Tuple[Tuple[str, frozenset, Optional["re.Pattern"]], ...]
+) -> Optional[str]:
+    """Label of the earliest-listed category with a whole-word keyword in ``text``, if any."""
+    for label, words, pattern in categories:
+        if not words.isdisjoint(tokens) or (pattern is not None and pattern.search(text)):
+            return label
+    return None
+
+
+def _substring_categories(
+    categories: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Tuple["re.Pattern", Dict[str, frozenset], int]:
+    """
+    One lookahead alternation over every category's keywords, the labels each match implies
+    and the number of labels.
+    
+    The lookahead tries every start position but reports only the longest keyword
+    found there, so a match also carries the labels of the keywords that are its
+    prefixes ("market" implies "mark"). This keeps plain substring semantics.
+    """
+    keyword_labels = defaultdict(set)
+    for label, keywords in categories:
+        for keyword in keywords:
+            keyword_labels[keyword].add(label)
+    
+    labels_by_keyword = {
+        keyword: frozenset().union(*(
+            labels for prefix, labels in keyword_labels.items() if keyword.startswith(prefix)
+        ))
+        for keyword in keyword_labels
+    }
+    alternation = "|".join(re.escape(keyword) for keyword in sorted(keyword_labels, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), labels_by_keyword, len(categories)
+
+
+def _matching_categories(
+    text: str,
+    categories: Tuple["re.Pattern", Dict[str, frozenset], int]
+) -> set:
+    """Labels of every category with a keyword in ``text``, found in one pass over it."""
+    pattern, labels_by_keyword, label_count = categories
+    found = set()
+    for match in pattern.finditer(text):
+        found |= labels_by_keyword[match.group(1)]
+        if len(found) == label_count:
+            break
+    return found
+
+
+def _compile_keywords(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """
+    One substring alternation for a keyword list, longest keywords first.
+    
+    Used for short fields such as skill names, where a single compiled search
+    beats a generator of ``in`` checks; long descriptions stay on ``in``, which
+    scans faster than the regex engine.
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+# Whole-word variants of the tier and industry tables ("biotech" is not "tech")
+_COMPANY_TIER_WORDS = _word_categories(_COMPANY_TIER_KEYWORDS)
+_INDUSTRY_FOCUS_WORDS = _word_categories(_INDUSTRY_FOCUS_KEYWORDS)
+
+# Achievement keywords keep substring matching ("led" also counts in "scaled")
+_ACHIEVEMENT_CATEGORIES = _substring_categories(_ACHIEVEMENT_KEYWORDS)
+
+# Title word -> (priority, seniority level); the lowest priority wins when a title has several
+_TITLE_LEVELS = {
+    keyword: (priority, level)
+    for priority, (level, keywords) in enumerate((
+        ("SENIOR", ("senior", "lead", "principal", "director", "vp", "head", "chief")),
+        ("MANAGER", ("manager",)),
+        ("JUNIOR", ("junior", "associate")),
+    ))
+    for keyword in keywords
+}
+
+
+def _classify_title(title_lower: str) -> str:
+    """Seniority level of a lowercased job title: one tokenization and a dict lookup per word."""
+    best = None
+    for token in _TOKEN_RE.findall(title_lower):
+        match = _TITLE_LEVELS.get(token)
+        if match is not None and (best is None or match < best):
+            best = match
+    return best[1] if best is not None else "MID"
+
+# Skills that count towards the modernization index (matched against lowercased skill names)
+_MODERN_TECH_PATTERN = _compile_keywords((
+    "python", "javascript", "react", "aws", "kubernetes", "docker", "ai", "machine learning",
+    "llm", "gpt", "cloud", "devops", "ci/cd", "terraform", "golang"
+))
+
+
+class _LRUCache(OrderedDict):
+    """
+    Thread-safe, size-bounded LRU mapping used as the in-memory profile cache.
+    
+    Reads refresh recency; writes beyond ``maxsize`` evict the least recently used entry.
+    """
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return super().__getitem__(key)
+    
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while self.maxsize and len(self) > self.maxsize:
+                self.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        with self._lock:
+            return super().pop(key, default)
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket allowing ``rate`` requests per second.
+    
+    Up to ``capacity`` requests (default: one second's worth) may burst; callers
+    beyond that reserve the next free slot and sleep until it arrives.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+@dataclass(slots=True)
+class ProfileData:
+    """
+    Scraped LinkedIn profile, parsed once where the scrape tool returns it.
+    
+    Fields the scrape did not return stay ``None`` and are skipped when merging.
+    """
+    work_experience: Optional[List[Dict[str, Any]]] = None
+    education: Optional[List[Dict[str, Any]]] = None
+    certifications: Optional[List[Any]] = None
+    languages: Optional[List[Any]] = None
+    endorsements: Optional[Dict[str, Any]] = None
+    connections_count: Optional[int] = None
+    skills: Optional[List[str]] = None
+    summary: Optional[str] = None
+    headline: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProfileData":
+        """Build from a scrape payload, ignoring fields the agent does not use."""
+        profile = cls(**{name: data[name] for name in _PROFILE_FIELDS if name in data})
+        if profile.skills is not None:
+            profile.skills = [_intern_skill(skill) for skill in profile.skills]
+        return profile
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _PROFILE_FIELDS if getattr(self, name) is not None}
+
+
+_PROFILE_FIELDS = tuple(f.name for f in fields(ProfileData))
+
+
+@functools.lru_cache(maxsize=100_000)
+def _canonical_linkedin_url(linkedin_url: str) -> str:
+    """
+    Normalise a profile URL so duplicate candidates share one lookup and cache key.
+    
+    Scheme, ``www.`` prefix, tracking parameters, fragment, trailing slash and
+    case are all dropped: ``http://www.LinkedIn.com/in/john-doe/?utm_source=x``
+    becomes ``https://linkedin.com/in/john-doe``.
+    """
+    linkedin_url = linkedin_url.strip().lower()
+    if "//" not in linkedin_url:
+        linkedin_url = "//" + linkedin_url
+    parts = urlsplit(linkedin_url)
+    host = parts.netloc.removeprefix("www.")
+    return f"https://{host}{parts.path.rstrip('/')}"
+
 
 class ProfileScrapingAgent:
     """
@@ -46,13 +550,61 @@ class ProfileScrapingAgent:
         self.config = {
             "max_retries": 3,
             "retry_delay": 2,  # seconds
-            "rate_limit_delay": 1,  # seconds between requests
+            "rate_limit_delay": 1,  # seconds between requests (shared by all workers)
+            "rate_limit_rps": None,  # token-bucket cap allowing bursts; overrides rate_limit_delay
             "batch_size": 10,  # process in batches to manage rate limits
-            "enable_caching": True
+            "concurrency": 8,  # worker threads / simultaneous scrape calls
+            "enable_caching": True,
+            "copy_candidates": True,  # False lets enrichment update the request's dicts in place
+            "cache_dir": os.getenv("PROFILE_CACHE_DIR"),  # enables the persistent cache
+            "cache_size_limit": int(os.getenv("PROFILE_CACHE_BYTES", 2 ** 30)),  # bytes on disk
+            "cache_ttl_seconds": 86400,
+            "cache_max_size": 10000,  # profiles kept in memory (LRU)
+            "negative_cache_ttl": 3600,  # seconds to remember not-found/private profiles
+            "analysis_cache_size": 10000  # deep analyses memoized by work history + skills; 0 disables
         }
         
-        # Cached profiles (simple in-memory cache)
-        self._profile_cache = {}
+        # Cached profiles (bounded in-memory tier in front of the optional disk cache)
+        self._profile_cache = _LRUCache(self.config["cache_max_size"])
+        self._disk_cache = self._open_disk_cache()
+        
+        # Deep analyses keyed by the work history fields and skills they were computed from
+        self._analysis_cache = _LRUCache(self.config["analysis_cache_size"])
+        
+        # Worker threads for the sync scrape tool; created on first batch
+        self._executor = None
+        self._scrape_slots = threading.BoundedSemaphore(self.config["concurrency"])
+        self._rate_limiter = None
+        
+        # Consecutive rate-limit responses, used to stretch retry backoff
+        self._consecutive_429s = 0
+        self._backoff_lock = threading.Lock()
+    
+    def _open_disk_cache(self) -> Optional["diskcache.Cache"]:
+        """Open the persistent profile cache when a cache directory is configured."""
+        cache_dir = self.config.get("cache_dir")
+        if not cache_dir:
+            return None
+        
+        if diskcache is None:
+            logger.warning("⚠️ PROFILE_CACHE_DIR is set but diskcache is not installed; using in-memory cache only")
+            return None
+        
+        # Evict least recently *read* profiles first once size_limit is reached
+        return diskcache.Cache(
+            cache_dir,
+            size_limit=self.config["cache_size_limit"],
+            eviction_policy="least-recently-used"
+        )
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool that runs the blocking scrape tool off the caller's thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config["concurrency"],
+                thread_name_prefix="profile-scrape"
+            )
+        return self._executor
     
     def enrich_candidates(
         self,
@@ -87,85 +639,404 @@ class ProfileScrapingAgent:
             # Merge custom config
             config = {**self.config, **enrichment_config}
             
+            # The whole request is one enrichment event; every record shares its timestamp
+            batch_ts = datetime.now().isoformat()
+            
+            # Group duplicate profiles so each unique URL is enriched once
+            candidate_groups = self._group_candidates_by_url(candidates)
+            
             # Process candidates in batches
-            enriched_candidates = self._process_candidates_in_batches(
-                candidates=candidates,
+            successful, failed = self._process_candidates_in_batches(
+                candidate_groups=candidate_groups,
                 project_metadata=project_metadata,
-                config=config
+                config=config,
+                batch_ts=batch_ts
             )
             
-            # Prepare response
-            response = self._prepare_enrichment_response(
-                enriched_candidates=enriched_candidates,
-                project_metadata=project_metadata,
-                total_processed=len(candidates)
+            return self._finish_enrichment(
+                successful, failed, project_metadata, len(candidates), batch_ts, candidate_groups
             )
             
-            # Update prospects in database via DatabaseAgent
-            if enriched_candidates:
-                updated_count = self._update_prospects_in_database(enriched_candidates)
-                response["enrichment_stats"]["database_updated"] = updated_count
-                logger.info(f"💾 Updated {updated_count} prospects in database via DatabaseAgent")
+        except Exception as e:
+            logger.error(f"❌ Profile enrichment failed: {e}")
+            return self._create_error_response(str(e), sourcing_manager_request)
+    
+    async def enrich_candidates_async(
+        self,
+        sourcing_manager_request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of ``enrich_candidates`` for callers already on an event loop.
+        
+        Every unique profile becomes a task; at most ``concurrency`` run at once and
+        scrape requests share the agent's rate limiter. Returns the same response.
+        """
+        logger.info(f"🔍 {self.name} enriching candidates for project {sourcing_manager_request.get('projectid', 'unknown')}")
+        
+        try:
+            candidates = sourcing_manager_request.get("candidates", [])
+            project_metadata = self._extract_project_metadata(sourcing_manager_request)
+            config = {**self.config, **sourcing_manager_request.get("enrichment_config", {})}
+            
+            if not candidates:
+                raise ValueError("No candidates provided for enrichment")
+            
+            logger.info(f"📋 Enriching {len(candidates)} candidate profiles")
+            
+            candidate_groups = self._group_candidates_by_url(candidates)
+            enrichment_timestamp = datetime.now().isoformat()
+            semaphore = asyncio.Semaphore(max(1, config.get("concurrency", 8)))
+            
+            async def guarded(linkedin_url: str, group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._enrich_candidate_group,
+                        linkedin_url, group, project_metadata, config, enrichment_timestamp
+                    )
             
-            logger.info(f"✅ Enrichment completed: {len(response['enriched_candidates'])} enriched, {response['enrichment_stats']['failed_count']} failed")
+            results = await asyncio.gather(
+                *(guarded(linkedin_url, group) for linkedin_url, group in candidate_groups.items()),
+                return_exceptions=True
+            )
             
-            return response
+            successful = []
+            failed = []
+            for group, result in zip(candidate_groups.values(), results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Enrichment task failed: {result}")
+                    result = [
+                        self._mark_enrichment_failed(
+                            candidate, str(result), enrichment_timestamp,
+                            copy=config.get("copy_candidates", True)
+                        )
+                        for candidate in group
+                    ]
+                for enriched in result:
+                    if enriched["enrichment_status"] == "success":
+                        successful.append(enriched)
+                    else:
+                        failed.append(enriched)
+            
+            return await asyncio.to_thread(
+                self._finish_enrichment,
+                successful, failed, project_metadata, len(candidates), enrichment_timestamp,
+                candidate_groups
+            )
             
         except Exception as e:
             logger.error(f"❌ Profile enrichment failed: {e}")
             return self._create_error_response(str(e), sourcing_manager_request)
     
+    def _finish_enrichment(
+        self,
+        successful: List[Dict[str, Any]],
+        failed: List[Dict[str, Any]],
+        project_metadata: Dict[str, Any],
+        total_processed: int,
+        batch_ts: Optional[str] = None,
+        candidate_groups: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the enrichment response and store the results via DatabaseAgent.
+        
+        ``candidate_groups`` (from ``_group_candidates_by_url``) gives the input
+        order of the profiles; database updates are written in that order.
+        """
+        
+        # Prepare response
+        response = self._prepare_enrichment_response(
+            successful=successful,
+            failed=failed,
+            project_metadata=project_metadata,
+            total_processed=total_processed,
+            enrichment_timestamp=batch_ts
+        )
+        
+        # Update prospects in database via DatabaseAgent
+        if successful or failed:
+            enriched = [*successful, *failed]
+            if candidate_groups:
+                # Successful and failed are split lists; restore the input order
+                position = {url: index for index, url in enumerate(candidate_groups)}
+                
+                def input_position(candidate: Dict[str, Any]) -> int:
+                    linkedin_url = candidate.get("linkedin_url") or candidate.get("profile_url")
+                    return position.get(_canonical_linkedin_url(linkedin_url) if linkedin_url else "", len(position))
+                
+                enriched.sort(key=input_position)
+            updated_count = self._update_prospects_in_database(enriched)
+            response["enrichment_stats"]["database_updated"] = updated_count
+            logger.info(f"💾 Updated {updated_count} prospects in database via DatabaseAgent")
+        
+        logger.info(f"✅ Enrichment completed: {len(response['enriched_candidates'])} enriched, {response['enrichment_stats']['failed_count']} failed")
+        
+        return response
+    
+    def _group_candidates_by_url(
+        self,
+        candidates: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bucket candidates by canonical LinkedIn URL, preserving first-seen order.
+        
+        Candidates without a URL share the empty-string bucket.
+        """
+        url_to_candidates = defaultdict(list)
+        for candidate in candidates:
+            linkedin_url = candidate.get("linkedin_url") or candidate.get("profile_url")
+            url_to_candidates[_canonical_linkedin_url(linkedin_url) if linkedin_url else ""].append(candidate)
+        
+        # Candidates without a URL are never looked up, so they are not duplicates
+        with_url = len(candidates) - len(url_to_candidates.get("", ()))
+        unique_urls = len(url_to_candidates) - ("" in url_to_candidates)
+        duplicates = with_url - unique_urls
+        if duplicates:
+            logger.info(
+                f"🔁 {with_url} candidates share {unique_urls} unique profiles; "
+                f"skipping {duplicates} duplicate lookups"
+            )
+        
+        return url_to_candidates
+    
     def _process_candidates_in_batches(
         self,
-        candidates: List[Dict[str, Any]],
+        candidate_groups: Dict[str, List[Dict[str, Any]]],
         project_metadata: Dict[str, Any],
-        config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Process candidates in batches to manage rate limits."""
+        config: Dict[str, Any],
+        batch_ts: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Process unique profiles in batches to manage rate limits.
         
-        enriched_candidates = []
+        Profiles within a batch are looked up on the agent's thread pool, so one
+        worker's request is in flight while another waits on the network. Results
+        are collected as they complete; request pacing is left to the shared rate
+        limiter in ``_scrape_linkedin_profile``.
+        
+        Returns:
+            Tuple of (successful, failed) enriched candidate lists
+        """
+        
+        successful = []
+        failed = []
         batch_size = config.get("batch_size", 10)
+        groups = list(candidate_groups.items())
+        
+        # One timestamp for the whole run instead of one per record
+        enrichment_timestamp = batch_ts or datetime.now().isoformat()
+        
+        executor = self._get_executor()
         
-        for i in range(0, len(candidates), batch_size):
-            batch = candidates[i:i + batch_size]
-            logger.info(f"📦 Processing batch {i//batch_size + 1}/{(len(candidates)-1)//batch_size + 1}")
+        for i in range(0, len(groups), batch_size):
+            batch = groups[i:i + batch_size]
+            logger.info(f"📦 Processing batch {i//batch_size + 1}/{(len(groups)-1)//batch_size + 1}")
             
-            for candidate in batch:
-                enriched = self._enrich_single_candidate(candidate, project_metadata, config)
-                enriched_candidates.append(enriched)
-                
-                # Rate limiting between requests
-                if config.get("rate_limit_delay", 0) > 0:
-                    time.sleep(config["rate_limit_delay"])
+            futures = [
+                executor.submit(
+                    self._enrich_candidate_group,
+                    linkedin_url, group, project_metadata, config, enrichment_timestamp
+                )
+                for linkedin_url, group in batch
+            ]
+            
+            for future in as_completed(futures):
+                for enriched in future.result():
+                    if enriched["enrichment_status"] == "success":
+                        successful.append(enriched)
+                    else:
+                        failed.append(enriched)
         
-        return enriched_candidates
+        return successful, failed
+    
+    async def enrich_candidates_stream(
+        self,
+        sourcing_manager_request: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream enriched candidates as each lookup completes.
+        
+        Takes the same request as ``enrich_candidates`` but yields every enriched or
+        failed candidate as soon as it is ready, so the caller can hand records to the
+        Database Agent without buffering the whole project. At most ``concurrency``
+        lookups are in flight. The last item is a summary record::
+        
+            {"stream_complete": True, "enrichment_stats": {...}, "project_metadata": {...}}
+        
+        Unlike ``enrich_candidates`` the stream does not write to the database itself.
+        """
+        candidates = sourcing_manager_request.get("candidates", [])
+        project_metadata = self._extract_project_metadata(sourcing_manager_request)
+        config = {**self.config, **sourcing_manager_request.get("enrichment_config", {})}
+        
+        enrichment_timestamp = datetime.now().isoformat()
+        groups = iter(self._group_candidates_by_url(candidates).items())
+        concurrency = max(1, config.get("concurrency", 8))
+        success_count = 0
+        failed_count = 0
+        
+        def schedule() -> Optional[asyncio.Task]:
+            item = next(groups, None)
+            if item is None:
+                return None
+            return asyncio.create_task(asyncio.to_thread(
+                self._enrich_candidate_group,
+                item[0], item[1], project_metadata, config, enrichment_timestamp
+            ))
+        
+        pending = set()
+        for _ in range(concurrency):
+            task = schedule()
+            if task is None:
+                break
+            pending.add(task)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Keep the window full before handing results to the consumer
+                    next_task = schedule()
+                    if next_task is not None:
+                        pending.add(next_task)
+                    
+                    for enriched in task.result():
+                        if enriched["enrichment_status"] == "success":
+                            success_count += 1
+                        else:
+                            failed_count += 1
+                        yield enriched
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        total_processed = len(candidates)
+        yield {
+            "stream_complete": True,
+            "enrichment_stats": {
+                "total_processed": total_processed,
+                "success_count": success_count,
+                "failed_count": failed_count,
+                "success_rate": success_count / total_processed if total_processed > 0 else 0
+            },
+            "project_metadata": project_metadata
+        }
+    
+    def _get_rate_limiter(self, config: Dict[str, Any]) -> Optional[_TokenBucket]:
+        """
+        Token bucket shared by all worker threads, rebuilt if the configured rate changes.
+        
+        ``rate_limit_rps`` allows bursts of one second's worth of requests;
+        otherwise ``rate_limit_delay`` spaces every request evenly.
+        """
+        if config.get("rate_limit_rps"):
+            rate = config["rate_limit_rps"]
+            capacity = max(1.0, rate)
+        elif config.get("rate_limit_delay", 0) > 0:
+            rate = 1 / config["rate_limit_delay"]
+            capacity = 1.0
+        else:
+            return None
+        
+        limiter = self._rate_limiter
+        if limiter is None or (limiter.rate, limiter.capacity) != (rate, capacity):
+            limiter = self._rate_limiter = _TokenBucket(rate, capacity)
+        return limiter
     
     def _enrich_single_candidate(
         self,
         candidate: Dict[str, Any],
         project_metadata: Dict[str, Any],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        enrichment_timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Enrich a single candidate profile with detailed LinkedIn data."""
         
         linkedin_url = candidate.get("linkedin_url") or candidate.get("profile_url")
+        return self._enrich_candidate_group(
+            _canonical_linkedin_url(linkedin_url) if linkedin_url else "",
+            [candidate],
+            project_metadata,
+            config,
+            enrichment_timestamp
+        )[0]
+    
+    def _enrich_candidate_group(
+        self,
+        linkedin_url: str,
+        candidates: List[Dict[str, Any]],
+        project_metadata: Dict[str, Any],
+        config: Dict[str, Any],
+        enrichment_timestamp: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Look up one profile and fan the result out to every candidate sharing its URL."""
+        
+        if enrichment_timestamp is None:
+            enrichment_timestamp = datetime.now().isoformat()
+        
+        # With copy_candidates=False the caller owns the dicts and they are updated in place
+        copy_candidates = config.get("copy_candidates", True)
         
         if not linkedin_url:
-            logger.warning(f"⚠️ No LinkedIn URL for candidate {candidate.get('full_name', 'unknown')}")
-            return self._mark_enrichment_failed(candidate, "No LinkedIn URL provided")
+            for candidate in candidates:
+                logger.warning(f"⚠️ No LinkedIn URL for candidate {candidate.get('full_name', 'unknown')}")
+            return [
+                self._mark_enrichment_failed(
+                    candidate, "No LinkedIn URL provided", enrichment_timestamp, copy=copy_candidates
+                )
+                for candidate in candidates
+            ]
+        
+        profile_data, from_cache, error_message = self._resolve_profile(linkedin_url, config)
+        
+        if profile_data is None:
+            for candidate in candidates:
+                logger.warning(f"⚠️ Failed to enrich profile: {candidate.get('full_name', 'unknown')}")
+            return [
+                self._mark_enrichment_failed(candidate, error_message, enrichment_timestamp, copy=copy_candidates)
+                for candidate in candidates
+            ]
         
-        # Check cache first
-        if config.get("enable_caching") and linkedin_url in self._profile_cache:
-            logger.info(f"💾 Using cached profile for {linkedin_url}")
-            cached_data = self._profile_cache[linkedin_url]
-            enriched_candidate = self._merge_enrichment_data(candidate, cached_data, from_cache=True)
+        enriched_candidates = []
+        for candidate in candidates:
+            enriched_candidate = self._merge_enrichment_data(
+                candidate,
+                profile_data,
+                from_cache=from_cache,
+                copy=copy_candidates
+            )
             
             # Add project metadata and status
             enriched_candidate["project_metadata"] = project_metadata
-            enriched_candidate["enrichment_timestamp"] = datetime.now().isoformat()
+            enriched_candidate["enrichment_timestamp"] = enrichment_timestamp
             enriched_candidate["enrichment_status"] = "success"
             
-            return enriched_candidate
+            if not from_cache:
+                logger.info(f"✅ Successfully enriched profile: {candidate.get('full_name', 'unknown')}")
+            enriched_candidates.append(enriched_candidate)
+        
+        return enriched_candidates
+    
+    def _resolve_profile(
+        self,
+        linkedin_url: str,
+        config: Dict[str, Any]
+    ) -> Tuple[Optional[ProfileData], bool, Optional[str]]:
+        """
+        Fetch profile data from the cache or a live scrape.
+        
+        Returns:
+            Tuple of (profile_data or None, from_cache, error_message)
+        """
+        
+        # Check cache first
+        cache_entry = self._get_cache_entry(linkedin_url, config) if config.get("enable_caching") else None
+        if cache_entry is not None and cache_entry["status"] == "failed":
+            logger.info(f"💾 Using cached failure for {linkedin_url}: {cache_entry['error']}")
+            return None, True, cache_entry["error"]
+        
+        if cache_entry is not None:
+            logger.info(f"💾 Using cached profile for {linkedin_url}")
+            return cache_entry["data"], True, None
         
         # Attempt to scrape profile
         enrichment_data = self._scrape_linkedin_profile(linkedin_url, config)
@@ -173,25 +1044,96 @@ class ProfileScrapingAgent:
         if enrichment_data.get("success"):
             # Cache the result
             if config.get("enable_caching"):
-                self._profile_cache[linkedin_url] = enrichment_data["profile_data"]
-            
-            # Merge with candidate data
-            enriched_candidate = self._merge_enrichment_data(
-                candidate, 
-                enrichment_data["profile_data"],
-                from_cache=False
-            )
-            
-            # Add project metadata
-            enriched_candidate["project_metadata"] = project_metadata
-            enriched_candidate["enrichment_timestamp"] = datetime.now().isoformat()
-            enriched_candidate["enrichment_status"] = "success"
-            
-            logger.info(f"✅ Successfully enriched profile: {candidate.get('full_name', 'unknown')}")
-            return enriched_candidate
-        else:
-            logger.warning(f"⚠️ Failed to enrich profile: {candidate.get('full_name', 'unknown')}")
-            return self._mark_enrichment_failed(candidate, enrichment_data.get("error", "Unknown error"))
+                self._cache_profile(linkedin_url, enrichment_data["profile_data"], config)
+            return enrichment_data["profile_data"], False, None
+        
+        error_message = enrichment_data.get("error", "Unknown error")
+        
+        # Remember stable failures so the retry ladder is skipped next time
+        if config.get("enable_caching") and _is_permanent_scrape_error(error_message):
+            self._cache_failure(linkedin_url, error_message, config)
+        
+        return None, False, error_message
+    
+    def _get_cache_entry(
+        self,
+        linkedin_url: str,
+        config: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cache entry in memory first, then in the persistent cache.
+        
+        Entries are ``{"status": "ok"|"failed", "data": ..., "error": ..., "ts": ...}``.
+        """
+        
+        # In-memory entries are (time.monotonic() expiry or None, cache entry)
+        memory_entry = self._profile_cache.get(linkedin_url)
+        if memory_entry is not None:
+            expires_at, cache_entry = memory_entry
+            if expires_at is None or time.monotonic() < expires_at:
+                return cache_entry
+            self._profile_cache.pop(linkedin_url, None)
+        
+        if self._disk_cache is not None:
+            cache_entry, expire_time = self._disk_cache.get(linkedin_url, expire_time=True)
+            if cache_entry is not None:
+                # Promote to the in-memory tier, keeping the remaining disk lifetime
+                ttl = expire_time - time.time() if expire_time is not None else None
+                self._store_in_memory(linkedin_url, cache_entry, ttl)
+                return cache_entry
+        
+        return None
+    
+    def _get_cached_profile(
+        self,
+        linkedin_url: str,
+        config: Dict[str, Any]
+    ) -> Optional[ProfileData]:
+        """Return cached profile data, ignoring cached failures."""
+        cache_entry = self._get_cache_entry(linkedin_url, config)
+        if cache_entry is not None and cache_entry["status"] == "ok":
+            return cache_entry["data"]
+        return None
+    
+    def _cache_profile(
+        self,
+        linkedin_url: str,
+        profile_data: ProfileData,
+        config: Dict[str, Any]
+    ) -> None:
+        """Store a scraped profile in memory and, if configured, on disk."""
+        cache_entry = {"status": "ok", "data": profile_data, "error": None, "ts": time.time()}
+        self._store_cache_entry(linkedin_url, cache_entry, config.get("cache_ttl_seconds"))
+    
+    def _cache_failure(
+        self,
+        linkedin_url: str,
+        error_message: str,
+        config: Dict[str, Any]
+    ) -> None:
+        """Store a stable scrape failure with the shorter negative TTL."""
+        cache_entry = {"status": "failed", "data": None, "error": error_message, "ts": time.time()}
+        self._store_cache_entry(linkedin_url, cache_entry, config.get("negative_cache_ttl", 3600))
+    
+    def _store_cache_entry(
+        self,
+        linkedin_url: str,
+        cache_entry: Dict[str, Any],
+        ttl: Optional[float]
+    ) -> None:
+        self._store_in_memory(linkedin_url, cache_entry, ttl)
+        
+        if self._disk_cache is not None:
+            self._disk_cache.set(linkedin_url, cache_entry, expire=ttl)
+    
+    def _store_in_memory(
+        self,
+        linkedin_url: str,
+        cache_entry: Dict[str, Any],
+        ttl: Optional[float]
+    ) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._profile_cache[linkedin_url] = (expires_at, cache_entry)
     
     def _scrape_linkedin_profile(
         self,
@@ -202,29 +1144,36 @@ class ProfileScrapingAgent:
         
         max_retries = config.get("max_retries", 3)
         retry_delay = config.get("retry_delay", 2)
+        rate_limiter = self._get_rate_limiter(config)
         
         for attempt in range(max_retries):
             try:
                 logger.info(f"🔍 Scraping LinkedIn profile (attempt {attempt + 1}/{max_retries}): {linkedin_url}")
                 
-                # Call the LinkedIn profile scraping tool
-                result_json = LinkedIn_profile_scrape.invoke({
-                    "linkedin_url": linkedin_url
-                })
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                
+                # Call the LinkedIn profile scraping tool, bounded across worker threads
+                with self._scrape_slots:
+                    result_json = LinkedIn_profile_scrape.invoke({
+                        "linkedin_url": linkedin_url
+                    })
                 
-                result = json.loads(result_json) if isinstance(result_json, str) else result_json
+                # The tool returns a JSON string, parsed once here with orjson; a dict is used as-is
+                result = _json_loads(result_json) if isinstance(result_json, (str, bytes)) else result_json
                 
                 if result.get("success"):
+                    self._record_rate_limit(False)
                     return {
                         "success": True,
-                        "profile_data": result.get("profile_data", {})
+                        "profile_data": ProfileData.from_dict(result.get("profile_data") or {})
                     }
                 else:
                     error_msg = result.get("error", "Unknown error")
                     logger.warning(f"⚠️ Scraping failed (attempt {attempt + 1}): {error_msg}")
                     
                     if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
+                        time.sleep(self._retry_backoff(attempt, retry_delay, error_msg))
                         continue
                     else:
                         return {
@@ -236,7 +1185,7 @@ class ProfileScrapingAgent:
                 logger.error(f"❌ Exception during scraping (attempt {attempt + 1}): {e}")
                 
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    time.sleep(self._retry_backoff(attempt, retry_delay, str(e)))
                     continue
                 else:
                     return {
@@ -249,80 +1198,78 @@ class ProfileScrapingAgent:
             "error": "Max retries exceeded"
         }
     
+    def _retry_backoff(self, attempt: int, retry_delay: float, error_message: str) -> float:
+        """
+        Seconds to wait before the next attempt: exponential backoff with full jitter.
+        
+        Rate-limit errors stretch the base delay by the number of consecutive
+        429s seen across all workers, so a throttled agent backs off harder.
+        """
+        base_delay = retry_delay
+        if self._record_rate_limit(_is_rate_limit_error(error_message)):
+            base_delay *= self._consecutive_429s
+        
+        return random.uniform(0, min(base_delay * (2 ** attempt), _MAX_RETRY_DELAY))
+    
+    def _record_rate_limit(self, rate_limited: bool) -> bool:
+        """Track consecutive rate-limit responses; any other outcome resets the streak."""
+        with self._backoff_lock:
+            self._consecutive_429s = self._consecutive_429s + 1 if rate_limited else 0
+        return rate_limited
+    
     def _merge_enrichment_data(
         self,
         candidate: Dict[str, Any],
-        profile_data: Dict[str, Any],
-        from_cache: bool = False
+        profile_data: "ProfileData | Dict[str, Any]",
+        from_cache: bool = False,
+        copy: bool = True
     ) -> Dict[str, Any]:
-        """Merge scraped profile data with existing candidate data, including company history."""
-        
-        enriched = candidate.copy()
-        
-        # Add enrichment source
-        enriched["enrichment_source"] = "cache" if from_cache else "live_scrape"
-        
-        # Merge work experience
-        if "work_experience" in profile_data:
-            enriched["work_experience"] = profile_data["work_experience"]
+        """
+        Merge scraped profile data with existing candidate data, including company history.
         
-        # ENHANCED: Extract and enrich company history with background information
-        if "work_experience" in profile_data:
-            company_history = self._extract_company_history(profile_data["work_experience"])
-            enriched["company_history"] = company_history
-            logger.info(f"✅ Extracted company history for {len(company_history)} companies")
+        With ``copy=False`` the candidate dict is updated in place, avoiding a copy per
+        candidate when the caller owns the dicts (``copy_candidates`` config).
+        """
         
-        # Merge education
-        if "education" in profile_data:
-            enriched["education"] = profile_data["education"]
+        if isinstance(profile_data, dict):
+            profile_data = ProfileData.from_dict(profile_data)
         
-        # Merge skills
-        if "skills" in profile_data:
-            # Merge with existing skills, avoiding duplicates
-            existing_skills = set(enriched.get("skills", []))
-            new_skills = set(profile_data["skills"])
-            enriched["skills"] = list(existing_skills.union(new_skills))
+        enriched = candidate.copy() if copy else candidate
         
-        # Merge certifications
-        if "certifications" in profile_data:
-            enriched["certifications"] = profile_data["certifications"]
+        # Add enrichment source and drop any error left by an earlier failed attempt
+        enriched["enrichment_source"] = "cache" if from_cache else "live_scrape"
+        enriched.pop("enrichment_error", None)
         
-        # Merge languages
-        if "languages" in profile_data:
-            enriched["languages"] = profile_data["languages"]
+        # Merge fields that are copied over whenever the scrape returned them
+        for key in _MERGE_KEYS:
+            value = getattr(profile_data, key)
+            if value is not None:
+                enriched[key] = value
         
-        # Merge endorsements
-        if "endorsements" in profile_data:
-            enriched["endorsements"] = profile_data["endorsements"]
+        # Merge fields that only replace existing data when non-empty
+        for source_key, target_key in _NON_EMPTY_MERGE_KEYS:
+            value = getattr(profile_data, source_key)
+            if value:
+                enriched[target_key] = value
         
-        # Update profile summary if available
-        if "summary" in profile_data and profile_data["summary"]:
-            enriched["profile_summary"] = profile_data["summary"]
+        # Descriptions are lowercased once and shared by every keyword pass below
+        descriptions_lower = _lowered_descriptions(enriched.get("work_experience") or [])
         
-        # Update headline if available
-        if "headline" in profile_data and profile_data["headline"]:
-            enriched["headline"] = profile_data["headline"]
+        # ENHANCED: Extract and enrich company history with background information
+        if profile_data.work_experience is not None:
+            company_history = self._extract_company_history(profile_data.work_experience, descriptions_lower)
+            enriched["company_history"] = company_history
+            logger.info(f"✅ Extracted company history for {len(company_history)} companies")
         
-        # Add connection count
-        if "connections_count" in profile_data:
-            enriched["connections_count"] = profile_data["connections_count"]
+        # Merge skills with existing skills, avoiding duplicates (order-preserving, single pass)
+        if profile_data.skills is not None:
+            enriched["skills"] = list(dict.fromkeys(
+                map(_intern_skill, itertools.chain(enriched.get("skills", ()), profile_data.skills))
+            ))
         
         # DEEP ANALYSIS: Add advanced profile insights
         if "work_experience" in enriched and enriched["work_experience"]:
-            # Career progression analysis
-            enriched["career_analysis"] = self.analyze_career_progression(enriched["work_experience"])
-            
-            # Achievement extraction
-            enriched["achievements"] = self.extract_achievements_and_impact(enriched["work_experience"])
-            
-            # Skill evolution analysis
-            enriched["skill_analysis"] = self.analyze_skill_evolution(
-                enriched["work_experience"],
-                enriched.get("skills", [])
-            )
-            
-            # Comprehensive profile summary
-            enriched["deep_profile_summary"] = self.generate_deep_profile_summary(enriched)
+            enriched.update(self._analyze_work_experience(enriched, descriptions_lower))
             
             logger.info(f"✅ Deep profile analysis completed for {enriched.get('name', 'candidate')}")
         
@@ -331,14 +1278,16 @@ class ProfileScrapingAgent:
     def _mark_enrichment_failed(
         self,
         candidate: Dict[str, Any],
-        error_message: str
+        error_message: str,
+        enrichment_timestamp: Optional[str] = None,
+        copy: bool = True
     ) -> Dict[str, Any]:
-        """Mark a candidate as failed enrichment."""
+        """Mark a candidate as failed enrichment (in place when ``copy=False``)."""
         
-        failed_candidate = candidate.copy()
+        failed_candidate = candidate.copy() if copy else candidate
         failed_candidate["enrichment_status"] = "failed"
         failed_candidate["enrichment_error"] = error_message
-        failed_candidate["enrichment_timestamp"] = datetime.now().isoformat()
+        failed_candidate["enrichment_timestamp"] = enrichment_timestamp or datetime.now().isoformat()
         
         return failed_candidate
     
@@ -351,6 +1300,26 @@ class ProfileScrapingAgent:
             "search_id": request.get("search_id", "")
         }
     
+    @functools.cached_property
+    def _db_agent(self) -> "DatabaseAgent":
+        """DatabaseAgent used for prospect updates, built on first use and reused."""
+        if DatabaseAgent is None:
+            raise RuntimeError(f"DatabaseAgent is unavailable: {_database_agent_import_error}")
+        
+        db_state = DatabaseAgentState(
+            name="ProfileEnrichment_DatabaseAgent",
+            description="Database operations for profile enrichment",
+            tools=[], tool_descriptions=[], tool_input_types=[], tool_output_types=[],
+            input_type="dict", output_type="dict", intermediate_steps=[],
+            max_iterations=5, iteration_count=0, stop=False,
+            last_action="", last_observation="", last_input="", last_output="",
+            graph=None, memory=[], memory_limit=100, verbose=False,
+            temperature=0.7, top_k=50, top_p=0.9, frequency_penalty=0.0, presence_penalty=0.0,
+            best_of=1, n=1, logit_bias={}, seed=42, model=os.getenv("OPENAI_MODEL", "gpt-5"), api_key=""
+        )
+        
+        return DatabaseAgent(db_state)
+    
     def _update_prospects_in_database(self, enriched_candidates: List[Dict[str, Any]]) -> int:
         """
         Update enriched prospects in database via DatabaseAgent.
@@ -367,80 +1336,21 @@ class ProfileScrapingAgent:
         logger.info(f"📤 Updating {len(enriched_candidates)} prospects in database...")
         
         try:
-            from agents.database_agent import DatabaseAgent, DatabaseAgentState
-            
-            # Initialize DatabaseAgent
-            db_state = DatabaseAgentState(
-                name="ProfileEnrichment_DatabaseAgent",
-                description="Database operations for profile enrichment",
-                tools=[], tool_descriptions=[], tool_input_types=[], tool_output_types=[],
-                input_type="dict", output_type="dict", intermediate_steps=[],
-                max_iterations=5, iteration_count=0, stop=False,
-                last_action="", last_observation="", last_input="", last_output="",
-                graph=None, memory=[], memory_limit=100, verbose=False,
-                temperature=0.7, top_k=50, top_p=0.9, frequency_penalty=0.0, presence_penalty=0.0,
-                best_of=1, n=1, logit_bias={}, seed=42, model=os.getenv("OPENAI_MODEL", "gpt-5"), api_key=""
-            )
+            db_agent = self._db_agent
             
-            db_agent = DatabaseAgent(db_state)
-            
-            # Update each enriched candidate
-            updated_count = 0
+            # Collect updates per prospect, keyed by the URL the prospect was stored
+            # under (upsert_prospect uses the raw linkedin_url as _id)
+            updates_by_url = {}
             for candidate in enriched_candidates:
-                try:
-                    linkedin_url = candidate.get("linkedin_url") or candidate.get("profile_url")
-                    
-                    if not linkedin_url:
-                        logger.warning(f"⚠️ Skipping candidate without LinkedIn URL: {candidate.get('full_name')}")
-                        continue
-                    
-                    # Prepare updates for prospect
-                    updates = {
-                        "enrichment_status": candidate.get("enrichment_status", "success"),
-                        "enrichment_timestamp": candidate.get("enrichment_timestamp"),
-                        "enrichment_source": candidate.get("enrichment_source", "live_scrape")
-                    }
-                    
-                    # Add enriched fields if available
-                    if "work_experience" in candidate:
-                        updates["work_experience"] = candidate["work_experience"]
-                    
-                    if "education" in candidate:
-                        updates["education"] = candidate["education"]
-                    
-                    if "skills" in candidate:
-                        updates["skills"] = candidate["skills"]
-                    
-                    if "certifications" in candidate:
-                        updates["certifications"] = candidate["certifications"]
-                    
-                    if "languages" in candidate:
-                        updates["languages"] = candidate["languages"]
-                    
-                    if "endorsements" in candidate:
-                        updates["endorsements"] = candidate["endorsements"]
-                    
-                    if "profile_summary" in candidate:
-                        updates["profile_summary"] = candidate["profile_summary"]
-                    
-                    if "headline" in candidate:
-                        updates["headline"] = candidate["headline"]
-                    
-                    if "connections_count" in candidate:
-                        updates["connections_count"] = candidate["connections_count"]
-                    
-                    # Update prospect via DatabaseAgent
-                    success = db_agent.update_prospect(linkedin_url, updates)
-                    
-                    if success:
-                        updated_count += 1
-                        logger.debug(f"✅ Updated prospect: {linkedin_url}")
-                    else:
-                        logger.warning(f"⚠️ Prospect not found for update: {linkedin_url}")
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to update prospect {candidate.get('full_name', 'unknown')}: {e}")
+                linkedin_url = candidate.get("linkedin_url") or candidate.get("profile_url")
+                
+                if not linkedin_url:
+                    logger.warning(f"⚠️ Skipping candidate without LinkedIn URL: {candidate.get('full_name')}")
                     continue
+                
+                updates_by_url[linkedin_url] = self._build_prospect_updates(candidate)
+            
+            updated_count = db_agent.update_prospects(updates_by_url)
             
             logger.info(f"✅ Successfully updated {updated_count}/{len(enriched_candidates)} prospects in database")
             return updated_count
@@ -449,17 +1359,31 @@ class ProfileScrapingAgent:
             logger.error(f"❌ Error updating prospects in database: {e}")
             return 0
     
+    def _build_prospect_updates(self, candidate: Dict[str, Any]) -> Dict[str, Any]:
+        """Prospect fields to store for an enriched (or failed) candidate."""
+        
+        updates = {
+            "enrichment_status": candidate.get("enrichment_status", "success"),
+            "enrichment_timestamp": candidate.get("enrichment_timestamp"),
+            "enrichment_source": candidate.get("enrichment_source", "live_scrape")
+        }
+        
+        # Add enriched fields if available
+        for key in _PROSPECT_UPDATE_KEYS:
+            if key in candidate:
+                updates[key] = candidate[key]
+        
+        return updates
+    
     def _prepare_enrichment_response(
         self,
-        enriched_candidates: List[Dict[str, Any]],
+        successful: List[Dict[str, Any]],
+        failed: List[Dict[str, Any]],
         project_metadata: Dict[str, Any],
-        total_processed: int
+        total_processed: int,
+        enrichment_timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Prepare final enrichment response."""
-        
-        # Separate successful and failed enrichments
-        successful = [c for c in enriched_candidates if c.get("enrichment_status") == "success"]
-        failed = [c for c in enriched_candidates if c.get("enrichment_status") == "failed"]
+        """Prepare final enrichment response from already-partitioned results."""
         
         return {
             "success": True,
@@ -472,9 +1396,21 @@ class ProfileScrapingAgent:
                 "success_rate": len(successful) / total_processed if total_processed > 0 else 0
             },
             "project_metadata": project_metadata,
-            "enrichment_timestamp": datetime.now().isoformat()
+            "enrichment_timestamp": enrichment_timestamp or datetime.now().isoformat()
         }
     
+    def serialize_response(self, response: Dict[str, Any]) -> bytes:
+        """
+        Serialize an enrichment response for callers that ship it as bytes.
+        
+        Args:
+            response: Response returned by one of the enrich_candidates entry points
+            
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return _json_dumps(response)
+    
     def _create_error_response(
         self,
         error_message: str,
@@ -498,7 +1434,8 @@ class ProfileScrapingAgent:
     
     def _extract_company_history(
         self,
-        work_experience: List[Dict[str, Any]]
+        work_experience: List[Dict[str, Any]],
+        descriptions_lower: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract company background and history from work experience.
@@ -510,14 +1447,18 @@ class ProfileScrapingAgent:
         
         Args:
             work_experience: List of work experience entries
+            descriptions_lower: Lowercased descriptions, if the caller already has them
             
         Returns:
             List of enriched company history entries with context
         """
         
         company_history = []
+        durations = self._calculate_durations(work_experience)
+        if descriptions_lower is None:
+            descriptions_lower = _lowered_descriptions(work_experience)
         
-        for position in work_experience:
+        for position, duration_months, desc_lower in zip(work_experience, durations, descriptions_lower):
             company_name = position.get("company", "Unknown")
             
             # Create company entry
@@ -528,18 +1469,15 @@ class ProfileScrapingAgent:
                 "start_date": position.get("start_date"),
                 "end_date": position.get("end_date"),
                 "is_current": position.get("current", False),
-                "duration_months": self._calculate_duration(
-                    position.get("start_date"),
-                    position.get("end_date"),
-                    position.get("current", False)
-                ),
+                "duration_months": duration_months,
                 "description": position.get("description", "")
             }
             
             # Extract company context clues from position description
             company_context = self._extract_company_context_from_description(
                 position.get("description", ""),
-                company_name
+                company_name,
+                desc_lower
             )
             
             # Merge context into company entry
@@ -552,7 +1490,8 @@ class ProfileScrapingAgent:
     def _extract_company_context_from_description(
         self,
         description: str,
-        company_name: str
+        company_name: str,
+        desc_lower: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Extract company background clues from job description.
@@ -562,6 +1501,8 @@ class ProfileScrapingAgent:
         - Industry/domain
         - Company stage (seed, series, growth, mature)
         - Type (B2B, B2C, SaaS, etc.)
+        
+        ``desc_lower`` is the already-lowercased description, when available.
         """
         
         context = {
@@ -575,50 +1516,14 @@ class ProfileScrapingAgent:
         if not description:
             return context
         
-        desc_lower = description.lower()
-        
-        # Size indicators
-        if any(term in desc_lower for term in ["startup", "early-stage", "early stage"]):
-            context["company_size"] = "Startup"
-            context["company_stage"] = "Early"
-        elif any(term in desc_lower for term in ["scale-up", "scaling", "hyper-growth", "growth stage"]):
-            context["company_size"] = "Growth"
-            context["company_stage"] = "Growth"
-        elif any(term in desc_lower for term in ["enterprise", "large", "multinational", "global"]):
-            context["company_size"] = "Large"
-            context["company_stage"] = "Mature"
-        elif any(term in desc_lower for term in ["mid-size", "mid size", "medium"]):
-            context["company_size"] = "Medium"
-            context["company_stage"] = "Established"
-        
-        # Industry indicators
-        if any(term in desc_lower for term in ["fintech", "banking", "finance", "financial services", "investment"]):
-            context["industry"] = "Financial Services"
-        elif any(term in desc_lower for term in ["healthcare", "pharmaceutical", "biotech", "medical"]):
-            context["industry"] = "Healthcare/Biotech"
-        elif any(term in desc_lower for term in ["software", "technology", "tech", "saas", "cloud", "development"]):
-            context["industry"] = "Technology"
-        elif any(term in desc_lower for term in ["consulting", "advisory"]):
-            context["industry"] = "Consulting"
-        elif any(term in desc_lower for term in ["retail", "e-commerce", "ecommerce", "commerce"]):
-            context["industry"] = "Retail/E-commerce"
-        elif any(term in desc_lower for term in ["education", "university", "school"]):
-            context["industry"] = "Education"
-        elif any(term in desc_lower for term in ["manufacturing", "industrial", "production"]):
-            context["industry"] = "Manufacturing"
-        elif any(term in desc_lower for term in ["marketing", "agency", "advertising"]):
-            context["industry"] = "Marketing/Advertising"
-        elif any(term in desc_lower for term in ["marketing", "agency", "advertising"]):
-            context["industry"] = "Marketing/Advertising"
-        
-        # Company type indicators
-        if any(term in desc_lower for term in ["b2b", "b2c", "b2g"]):
-            if "b2b" in desc_lower:
-                context["company_type"] = "B2B"
-            elif "b2c" in desc_lower:
-                context["company_type"] = "B2C"
-            elif "b2g" in desc_lower:
-                context["company_type"] = "B2G"
+        if desc_lower is None:
+            desc_lower = description.lower()
+        
+        # Template descriptions repeat across candidates; short ones are cheaper to rescan
+        if len(desc_lower) < _CONTEXT_CACHE_MIN_LENGTH:
+            context.update(_match_company_context(desc_lower))
+        else:
+            context.update(_cached_company_context(desc_lower))
         
         # Mark if we extracted useful context
         context["inferred_from_description"] = bool(
@@ -627,6 +1532,56 @@ class ProfileScrapingAgent:
         
         return context
     
+    def _calculate_durations(self, work_experience: List[Dict[str, Any]]) -> List[int]:
+        """
+        Employment durations in months for a whole work history.
+        
+        ISO date strings are converted to month precision in one NumPy pass; other
+        values (datetime objects, unparseable strings) go through ``_calculate_duration``.
+        """
+        
+        starts = [_iso_month(position.get("start_date")) for position in work_experience]
+        ends = [
+            _CURRENT_MONTH if position.get("current", False) else _iso_month(position.get("end_date"))
+            for position in work_experience
+        ]
+        
+        np = _numpy()
+        now_month = datetime.now().strftime("%Y-%m")
+        try:
+            start_months = np.array([start or "NaT" for start in starts], dtype="datetime64[M]")
+            end_months = np.array(
+                [now_month if end is _CURRENT_MONTH else (end or "NaT") for end in ends],
+                dtype="datetime64[M]"
+            )
+        except ValueError:
+            # e.g. "2020-02-30"; let the scalar path handle (and log) each date
+            return [
+                self._calculate_duration(
+                    position.get("start_date"),
+                    position.get("end_date"),
+                    position.get("current", False)
+                )
+                for position in work_experience
+            ]
+        
+        months = np.maximum((end_months - start_months).astype("int64"), 0).tolist()
+        
+        durations = []
+        for position, start, end, month_count in zip(work_experience, starts, ends, months):
+            if start and end:
+                durations.append(month_count)
+            elif not position.get("start_date") or (not position.get("current", False) and not position.get("end_date")):
+                durations.append(0)
+            else:
+                durations.append(self._calculate_duration(
+                    position.get("start_date"),
+                    position.get("end_date"),
+                    position.get("current", False)
+                ))
+        
+        return durations
+    
     def _calculate_duration(
         self,
         start_date: Optional[str],
@@ -639,26 +1594,28 @@ class ProfileScrapingAgent:
             return 0
         
         try:
-            from datetime import datetime
-            
-            start = datetime.fromisoformat(start_date.replace('Z', '+00:00')) if isinstance(start_date, str) else start_date
+            start_year, start_month = _year_month(start_date)
             
             if is_current:
-                end = datetime.now()
+                end_year, end_month = _year_month(datetime.now())
             elif end_date:
-                end = datetime.fromisoformat(end_date.replace('Z', '+00:00')) if isinstance(end_date, str) else end_date
+                end_year, end_month = _year_month(end_date)
             else:
                 return 0
             
             # Calculate months between dates
-            months = (end.year - start.year) * 12 + (end.month - start.month)
+            months = (end_year - start_year) * 12 + (end_month - start_month)
             return max(0, months)
         
         except Exception as e:
             logger.warning(f"⚠️ Could not calculate duration: {e}")
             return 0
     
-    def analyze_career_progression(self, work_experience: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_career_progression(
+        self,
+        work_experience: List[Dict[str, Any]],
+        descriptions_lower: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Deep analysis of career progression patterns beyond just skills.
         
@@ -673,6 +1630,9 @@ class ProfileScrapingAgent:
         if not work_experience or len(work_experience) == 0:
             return {}
         
+        if descriptions_lower is None:
+            descriptions_lower = _lowered_descriptions(work_experience)
+        
         analysis = {
             "total_positions": len(work_experience),
             "career_span_years": 0,
@@ -694,51 +1654,34 @@ class ProfileScrapingAgent:
             
             if start_date:
                 try:
-                    from datetime import datetime
-                    start = datetime.fromisoformat(start_date.replace('Z', '+00:00')) if isinstance(start_date, str) else start_date
-                    end = datetime.fromisoformat(end_date.replace('Z', '+00:00')) if end_date and isinstance(end_date, str) else (datetime.now() if not end_date else end_date)
-                    years = (end.year - start.year) + (end.month - start.month) / 12.0
+                    start_year, start_month = _year_month(start_date)
+                    end_year, end_month = _year_month(end_date or datetime.now())
+                    years = (end_year - start_year) + (end_month - start_month) / 12.0
                     analysis["career_span_years"] = round(years, 1)
                 except:
                     pass
             
             # Analyze company tier progression
-            company_types = []
-            for position in work_experience:
-                company_name = position.get("company", "")
-                desc = position.get("description", "").lower()
-                
-                # Heuristic detection of company stage
-                if any(word in desc for word in ["startup", "early stage", "seed", "series a"]):
-                    company_types.append("STARTUP")
-                elif any(word in desc for word in ["scale-up", "growth", "series b", "series c"]):
-                    company_types.append("SCALE_UP")
-                elif any(word in desc for word in ["enterprise", "fortune", "nasdaq", "s&p", "multinational"]):
-                    company_types.append("ENTERPRISE")
-                else:
-                    company_types.append("UNKNOWN")
+            # Each description is tokenized once for the stage and industry checks
+            description_tokens = [frozenset(_TOKEN_RE.findall(desc)) for desc in descriptions_lower]
+            
+            # Heuristic detection of company stage
+            company_types = [
+                _first_word_category(desc, tokens, _COMPANY_TIER_WORDS) or "UNKNOWN"
+                for desc, tokens in zip(descriptions_lower, description_tokens)
+            ]
             
             analysis["company_tier_progression"] = company_types
             
             # Detect progression pattern
             if len(work_experience) >= 2:
-                title_progression = []
-                for pos in work_experience:
-                    title_lower = pos.get("title", "").lower()
-                    if any(word in title_lower for word in ["senior", "lead", "principal", "director", "vp", "head", "chief"]):
-                        title_progression.append("SENIOR")
-                    elif any(word in title_lower for word in ["manager", "manager"]):
-                        title_progression.append("MANAGER")
-                    elif any(word in title_lower for word in ["junior", "associate"]):
-                        title_progression.append("JUNIOR")
-                    else:
-                        title_progression.append("MID")
+                title_progression = [_classify_title(pos.get("title", "").lower()) for pos in work_experience]
                 
                 # Detect trajectory
                 if title_progression[-1] in ["SENIOR", "MANAGER", "DIRECTOR"] and title_progression[0] != "SENIOR":
                     analysis["growth_trajectory"] = "UPWARD"
                     analysis["career_insights"].append("Strong growth trajectory - progressing to senior roles")
-                elif all(t == title_progression[0] for t in title_progression):
+                elif len(set(title_progression)) == 1:
                     analysis["growth_trajectory"] = "STABLE"
                     analysis["career_insights"].append("Consistent career level - deep expertise in similar roles")
                 else:
@@ -746,18 +1689,12 @@ class ProfileScrapingAgent:
                     analysis["career_insights"].append("Lateral moves - building diverse expertise")
             
             # Industry consistency analysis
-            industries = set()
-            for position in work_experience:
-                desc = position.get("description", "").lower()
-                # Simple industry detection
-                if any(word in desc for word in ["tech", "software", "ai", "machine learning", "cloud", "devops"]):
-                    industries.add("TECHNOLOGY")
-                elif any(word in desc for word in ["finance", "banking", "investment", "trading", "fintech"]):
-                    industries.add("FINANCE")
-                elif any(word in desc for word in ["healthcare", "medical", "pharma", "biotech"]):
-                    industries.add("HEALTHCARE")
-                elif any(word in desc for word in ["e-commerce", "retail", "sales", "marketing"]):
-                    industries.add("COMMERCE")
+            # Simple industry detection
+            industries = {
+                _first_word_category(desc, tokens, _INDUSTRY_FOCUS_WORDS)
+                for desc, tokens in zip(descriptions_lower, description_tokens)
+            }
+            industries.discard(None)
             
             if len(industries) == 1:
                 analysis["industry_focus"] = "SPECIALIZED"
@@ -767,15 +1704,16 @@ class ProfileScrapingAgent:
                 analysis["career_insights"].append("Cross-industry experience - adaptable generalist")
             
             # Job stability (tenure duration)
-            avg_tenure = 0
-            tenures = []
+            total_tenure = 0
+            tenure_count = 0
             for position in work_experience:
                 tenure = position.get("duration_months", 0)
                 if tenure > 0:
-                    tenures.append(tenure)
+                    total_tenure += tenure
+                    tenure_count += 1
             
-            if tenures:
-                avg_tenure = sum(tenures) / len(tenures)
+            if tenure_count:
+                avg_tenure = total_tenure / tenure_count
                 if avg_tenure > 36:  # 3+ years average
                     analysis["job_stability"] = "HIGH"
                     analysis["career_insights"].append("Long tenure at positions - committed, deep impact potential")
@@ -790,7 +1728,11 @@ class ProfileScrapingAgent:
         
         return analysis
     
-    def extract_achievements_and_impact(self, work_experience: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def extract_achievements_and_impact(
+        self,
+        work_experience: List[Dict[str, Any]],
+        descriptions_lower: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract achievements and measurable impact from job descriptions.
         
@@ -802,9 +1744,11 @@ class ProfileScrapingAgent:
         """
         
         achievements = []
+        if descriptions_lower is None:
+            descriptions_lower = _lowered_descriptions(work_experience)
         
         try:
-            for position in work_experience:
+            for position, desc_lower in zip(work_experience, descriptions_lower):
                 position_achievements = {
                     "position": position.get("title", "Unknown"),
                     "company": position.get("company", "Unknown"),
@@ -819,25 +1763,16 @@ class ProfileScrapingAgent:
                     continue
                 
                 # Look for quantified achievements
-                import re
-                numbers = re.findall(r'(\d+[%]|\$\d+[MK]?|\d+\s*(projects?|teams?|people|users|customers))', desc, re.IGNORECASE)
+                numbers = _QUANT_RE.findall(desc)
                 if numbers:
-                    position_achievements["quantified_achievements"] = list(set(numbers))  # Remove duplicates
-                
-                # Look for leadership keywords
-                leadership_words = ["led", "managed", "mentored", "supervised", "directed", "oversaw", "pioneered", "spearheaded"]
-                if any(word in desc.lower() for word in leadership_words):
-                    position_achievements["leadership_achievements"].append("Leadership/Management experience demonstrated")
+                    # Remove duplicates, keeping the order they appear in the description
+                    position_achievements["quantified_achievements"] = list(dict.fromkeys(numbers))
                 
-                # Look for technical keywords
-                technical_words = ["built", "designed", "architected", "implemented", "developed", "engineered", "optimized", "automated"]
-                if any(word in desc.lower() for word in technical_words):
-                    position_achievements["technical_achievements"].append("Technical delivery/innovation demonstrated")
+                # Look for leadership, technical and business impact keywords
+                categories = _matching_categories(desc_lower, _ACHIEVEMENT_CATEGORIES)
                 
-                # Look for business impact keywords
-                impact_words = ["revenue", "growth", "cost savings", "efficiency", "market", "launch", "scale", "expand"]
-                if any(word in desc.lower() for word in impact_words):
-                    position_achievements["business_impact"].append("Business impact/commercial focus demonstrated")
+                for category in categories:
+                    position_achievements[category].append(_ACHIEVEMENT_FLAGS[category])
                 
                 if any(position_achievements[key] for key in position_achievements if key != "position"):
                     achievements.append(position_achievements)
@@ -847,7 +1782,12 @@ class ProfileScrapingAgent:
         
         return achievements
     
-    def analyze_skill_evolution(self, work_experience: List[Dict[str, Any]], skills: List[str]) -> Dict[str, Any]:
+    def analyze_skill_evolution(
+        self,
+        work_experience: List[Dict[str, Any]],
+        skills: List[str],
+        descriptions_lower: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze how skills have evolved over the candidate's career.
         
@@ -869,14 +1809,17 @@ class ProfileScrapingAgent:
         }
         
         try:
-            # Analyze skill mentions across positions
-            skill_frequency = {}
+            if descriptions_lower is None:
+                descriptions_lower = _lowered_descriptions(work_experience)
+            skills_lower = [(skill, skill.lower()) for skill in skills]
             
-            for position in work_experience:
-                desc = position.get("description", "").lower()
-                for skill in skills:
-                    if skill.lower() in desc:
-                        skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
+            # Analyze skill mentions across positions
+            skill_frequency = Counter(
+                skill
+                for desc in descriptions_lower
+                for skill, skill_lower in skills_lower
+                if skill_lower in desc
+            )
             
             # Core skills appear in multiple positions
             if work_experience:
@@ -885,11 +1828,9 @@ class ProfileScrapingAgent:
             
             # Emerging skills in recent positions (last 1-2 positions)
             if len(work_experience) >= 1:
-                recent_desc = ""
-                for position in work_experience[:2]:  # Last 2 positions
-                    recent_desc += " " + position.get("description", "").lower()
+                recent_desc = " " + " ".join(descriptions_lower[:2])  # Last 2 positions
                 
-                analysis["emerging_skills"] = [s for s in skills if s.lower() in recent_desc and s not in analysis["core_skills"]]
+                analysis["emerging_skills"] = [s for s, s_lower in skills_lower if s_lower in recent_desc and s not in analysis["core_skills"]]
             
             # Analyze skill breadth
             if len(skills) > 20:
@@ -902,9 +1843,7 @@ class ProfileScrapingAgent:
                 analysis["skill_breadth"] = "NARROW"
             
             # Check for modern tech presence (simple heuristic)
-            modern_tech = ["python", "javascript", "react", "aws", "kubernetes", "docker", "ai", "machine learning", 
-                          "llm", "gpt", "cloud", "devops", "ci/cd", "terraform", "golang"]
-            modern_skills = [s for s in skills if any(tech in s.lower() for tech in modern_tech)]
+            modern_skills = [s for s, s_lower in skills_lower if _MODERN_TECH_PATTERN.search(s_lower)]
             analysis["modernization_index"] = min(1.0, len(modern_skills) / max(1, len(skills)))
             
             if analysis["modernization_index"] > 0.5:
@@ -915,10 +1854,68 @@ class ProfileScrapingAgent:
         
         return analysis
     
-    def generate_deep_profile_summary(self, enriched_candidate: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_work_experience(
+        self,
+        enriched_candidate: Dict[str, Any],
+        descriptions_lower: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every deep analysis over the candidate's work history exactly once.
+        
+        The summary reuses the career, achievement and skill analyses instead of
+        recomputing them, halving the passes over ``work_experience``. Descriptions
+        are lowercased once and shared by all of them.
+        
+        Results are memoized per work history, skills and month. The cache holds
+        them as JSON bytes, so every candidate gets its own copy to modify.
+        """
+        work_experience = enriched_candidate["work_experience"]
+        skills = enriched_candidate.get("skills", [])
+        
+        # Cache hits re-merge unchanged profiles; reuse their analysis instead of recomputing it
+        cache_key = _analysis_cache_key(work_experience, skills) if self._analysis_cache.maxsize else None
+        if cache_key is not None:
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return _json_loads(cached)
+        
+        if descriptions_lower is None:
+            descriptions_lower = _lowered_descriptions(work_experience)
+        
+        career_analysis = self.analyze_career_progression(work_experience, descriptions_lower)
+        achievements = self.extract_achievements_and_impact(work_experience, descriptions_lower)
+        skill_analysis = self.analyze_skill_evolution(work_experience, skills, descriptions_lower)
+        
+        analysis = {
+            "career_analysis": career_analysis,
+            "achievements": achievements,
+            "skill_analysis": skill_analysis,
+            "deep_profile_summary": self.generate_deep_profile_summary(
+                enriched_candidate,
+                career_prog=career_analysis,
+                achievements=achievements,
+                skill_evolution=skill_analysis
+            )
+        }
+        
+        if cache_key is not None:
+            self._analysis_cache[cache_key] = _json_dumps(analysis)
+        
+        return analysis
+    
+    def generate_deep_profile_summary(
+        self,
+        enriched_candidate: Dict[str, Any],
+        career_prog: Optional[Dict[str, Any]] = None,
+        achievements: Optional[List[Dict[str, Any]]] = None,
+        skill_evolution: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Generate comprehensive deep profile analysis combining all insights.
         
+        Analyses already computed for the candidate can be passed in; any that
+        are missing are run here.
+        
         Returns a summary highlighting:
         - Career narrative (how their career story reads)
         - Unique strengths beyond skills
@@ -940,10 +1937,15 @@ class ProfileScrapingAgent:
             work_exp = enriched_candidate.get("work_experience", [])
             skills = enriched_candidate.get("skills", [])
             
-            # Run all analyses
-            career_prog = self.analyze_career_progression(work_exp)
-            achievements = self.extract_achievements_and_impact(work_exp)
-            skill_evolution = self.analyze_skill_evolution(work_exp, skills)
+            # Run any analyses not supplied by the caller, sharing one lowercased copy of the descriptions
+            if career_prog is None or achievements is None or skill_evolution is None:
+                descriptions_lower = _lowered_descriptions(work_exp)
+            if career_prog is None:
+                career_prog = self.analyze_career_progression(work_exp, descriptions_lower)
+            if achievements is None:
+                achievements = self.extract_achievements_and_impact(work_exp, descriptions_lower)
+            if skill_evolution is None:
+                skill_evolution = self.analyze_skill_evolution(work_exp, skills, descriptions_lower)
             
             # Build career narrative
             trajectory = career_prog.get("growth_trajectory", "UNKNOWN")
@@ -961,8 +1963,9 @@ class ProfileScrapingAgent:
                 summary["growth_potential"] = "MEDIUM"
             
             # Unique strengths
+            # Copy so strengths added below don't leak into the career analysis
             insights = career_prog.get("career_insights", [])
-            summary["unique_strengths"] = insights
+            summary["unique_strengths"] = list(insights)
             
             # Learning agility
             if skill_evolution.get("continuous_learning"):
@@ -1007,10 +2010,15 @@ class ProfileScrapingAgent:
         return summary
     
     def clear_cache(self):
-        """Clear the profile cache."""
+        """Clear the profile cache, including the persistent tier."""
         self._profile_cache.clear()
+        self._analysis_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
         logger.info("🗑️ Profile cache cleared")
     
     def get_cache_size(self) -> int:
         """Get the current cache size."""
+        if self._disk_cache is not None:
+            return len(self._disk_cache)
         return len(self._profile_cache)
@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+@pytest.fixture(scope="module")
+def _patched_scrape_module():
+    """LinkedIn_profile_scrape patched out of the profile scraping agent once per test module."""
+    with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape', new_callable=Mock) as mock_scrape:
+        yield mock_scrape
+
+
+@pytest.fixture
+def patched_scrape(_patched_scrape_module):
+    """The module's patched LinkedIn_profile_scrape, with calls and responses cleared for each test.
+
+    Tests set ``patched_scrape.invoke.side_effect`` to the responses they need.
+    """
+    _patched_scrape_module.reset_mock(return_value=True, side_effect=True)
+    return _patched_scrape_module
@@ -6,89 +6,128 @@ No external APIs needed - everything is mocked
 
 import pytest
 import json
+import logging
+from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from itertools import islice
+from typing import Optional, Tuple
+
+from sub_agents.profile_scraping_agent import ProfileScrapingAgent
+
+log = logging.getLogger(__name__)
 
 
 # ==================== MOCK IMPLEMENTATIONS ====================
 
+@dataclass(slots=True)
+class EmailRecord:
+    """Email recorded by MockEmailService"""
+    to: str
+    subject: str
+    body: str
+    timestamp: str
+    status: str = "sent"
+
+
+@dataclass(slots=True)
+class LinkedInAction:
+    """Action recorded by MockLinkedInAPI"""
+    action: str
+    timestamp: str
+    provider_id: Optional[str] = None
+    message: Optional[str] = None
+    subject: Optional[str] = None
+    body: Optional[str] = None
+    post_id: Optional[str] = None
+    status: str = "success"
+
+
 class MockEmailService:
     """Mock SMTP email service"""
-    def __init__(self):
+    def __init__(self, timestamp: Optional[str] = None):
         self.sent_emails = []
+        self._timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+    
+    def reset(self):
+        """Forget all sent emails"""
+        self.sent_emails.clear()
     
     def send_email(self, to: str, subject: str, body: str) -> dict:
         """Mock email sending"""
-        email_record = {
-            "to": to,
-            "subject": subject,
-            "body": body,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "sent"
-        }
-        self.sent_emails.append(email_record)
+        self.sent_emails.append(EmailRecord(to, subject, body, self._timestamp))
         return {"status": "success", "message_id": f"msg-{len(self.sent_emails)}"}
 
 
 class MockLinkedInAPI:
     """Mock LinkedIn API via Unipile"""
-    def __init__(self):
+    def __init__(self, timestamp: Optional[str] = None):
         self.actions = []
+        self.counts = Counter()
+        self._timestamp = timestamp or datetime.now(timezone.utc).isoformat()
     
-    def send_connection_request(self, provider_id: str, message: str = None) -> dict:
-        """Mock connection request"""
-        action = {
-            "action": "connection_request",
-            "provider_id": provider_id,
-            "message": message,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "success"
-        }
+    def reset(self):
+        """Forget all recorded actions"""
+        self.actions.clear()
+        self.counts.clear()
+    
+    def count(self, kind: str) -> int:
+        """Number of recorded actions of the given type"""
+        return self.counts[kind]
+    
+    def _record(self, action: LinkedInAction) -> LinkedInAction:
         self.actions.append(action)
+        self.counts[action.action] += 1
         return action
     
-    def send_message(self, provider_id: str, message: str) -> dict:
+    def send_connection_request(self, provider_id: str, message: str = None) -> LinkedInAction:
+        """Mock connection request"""
+        return self._record(LinkedInAction(
+            action="connection_request",
+            provider_id=provider_id,
+            message=message,
+            timestamp=self._timestamp
+        ))
+    
+    def send_message(self, provider_id: str, message: str) -> LinkedInAction:
         """Mock direct message"""
-        action = {
-            "action": "direct_message",
-            "provider_id": provider_id,
-            "message": message,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "success"
-        }
-        self.actions.append(action)
-        return action
+        return self._record(LinkedInAction(
+            action="direct_message",
+            provider_id=provider_id,
+            message=message,
+            timestamp=self._timestamp
+        ))
     
-    def send_inmail(self, provider_id: str, subject: str, body: str) -> dict:
+    def send_inmail(self, provider_id: str, subject: str, body: str) -> LinkedInAction:
         """Mock InMail"""
-        action = {
-            "action": "inmail",
-            "provider_id": provider_id,
-            "subject": subject,
-            "body": body,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "success"
-        }
-        self.actions.append(action)
-        return action
+        return self._record(LinkedInAction(
+            action="inmail",
+            provider_id=provider_id,
+            subject=subject,
+            body=body,
+            timestamp=self._timestamp
+        ))
     
-    def like_post(self, post_id: str) -> dict:
+    def like_post(self, post_id: str) -> LinkedInAction:
         """Mock post like"""
-        action = {
-            "action": "post_like",
-            "post_id": post_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "status": "success"
-        }
-        self.actions.append(action)
-        return action
+        return self._record(LinkedInAction(
+            action="post_like",
+            post_id=post_id,
+            timestamp=self._timestamp
+        ))
 
 
 class MockMongoDatabase:
     """Mock MongoDB"""
-    def __init__(self):
+    def __init__(self, timestamp: Optional[str] = None):
         self.candidates = {}
         self.projects = {}
+        self._timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+    
+    def reset(self):
+        """Drop all stored candidates and projects"""
+        self.candidates.clear()
+        self.projects.clear()
     
     def save_candidate(self, candidate_data: dict) -> dict:
         """Save candidate to mock database"""
@@ -97,7 +136,17 @@ class MockMongoDatabase:
         return {
             "status": "success",
             "inserted_id": linkedin_url,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": self._timestamp
+        }
+    
+    def save_candidates(self, batch) -> dict:
+        """Save many candidates to mock database in one call"""
+        documents = {candidate_data.get("linkedin_url", ""): candidate_data for candidate_data in batch}
+        self.candidates.update(documents)
+        return {
+            "status": "success",
+            "inserted_count": len(documents),
+            "timestamp": self._timestamp
         }
     
     def update_candidate(self, linkedin_url: str, updates: dict) -> dict:
@@ -107,29 +156,178 @@ class MockMongoDatabase:
             return {"status": "success", "modified_count": 1}
         return {"status": "error", "modified_count": 0}
     
+    def update_candidates(self, updates_by_url: dict) -> dict:
+        """Apply a {linkedin_url: updates} mapping in one call"""
+        modified = 0
+        for linkedin_url, updates in updates_by_url.items():
+            modified += self.update_candidate(linkedin_url, updates)["modified_count"]
+        return {"status": "success" if modified else "error", "modified_count": modified}
+    
+    def mark_email_sent(self, linkedin_url: str, when: str = None) -> dict:
+        """Flag a candidate as emailed without building an update dict"""
+        candidate = self.candidates.get(linkedin_url)
+        if candidate is None:
+            return {"status": "error", "modified_count": 0}
+        candidate["email_contacted"] = True
+        candidate["email_date"] = when or self._timestamp
+        return {"status": "success", "modified_count": 1}
+    
+    def mark_connection_requested(self, linkedin_url: str) -> dict:
+        """Flag a candidate as sent a LinkedIn connection request"""
+        candidate = self.candidates.get(linkedin_url)
+        if candidate is None:
+            return {"status": "error", "modified_count": 0}
+        candidate["connectie_verzoek"] = True
+        return {"status": "success", "modified_count": 1}
+    
+    def find_by_min_score(self, threshold: int) -> list:
+        """Candidates scoring at least threshold, in insertion order"""
+        return [c for c in self.candidates.values() if c.get("suitability_score", 0) >= threshold]
+    
     def get_candidates(self, limit: int = 10) -> list:
         """Get candidates from mock database"""
-        return list(self.candidates.values())[:limit]
+        return list(islice(self.candidates.values(), limit))
 
 
 # ==================== FIXTURES ====================
 
+# Every mock stamps its records with this instant, so timestamps are deterministic
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+FROZEN_NOW_ISO = FROZEN_NOW.isoformat()
+
+
+# One mock of each kind per session, reset after every test; no test relies on
+# state left behind by another.
+
+@pytest.fixture(scope="session")
+def _email_service_pool():
+    return MockEmailService(FROZEN_NOW_ISO)
+
+
+@pytest.fixture(scope="session")
+def _linkedin_api_pool():
+    return MockLinkedInAPI(FROZEN_NOW_ISO)
+
+
+@pytest.fixture(scope="session")
+def _database_pool():
+    return MockMongoDatabase(FROZEN_NOW_ISO)
+
+
 @pytest.fixture
-def email_service():
+def email_service(_email_service_pool):
     """Fixture for mock email service"""
-    return MockEmailService()
+    yield _email_service_pool
+    _email_service_pool.reset()
 
 
 @pytest.fixture
-def linkedin_api():
+def linkedin_api(_linkedin_api_pool):
     """Fixture for mock LinkedIn API"""
-    return MockLinkedInAPI()
+    yield _linkedin_api_pool
+    _linkedin_api_pool.reset()
 
 
 @pytest.fixture
-def database():
+def database(_database_pool):
     """Fixture for mock database"""
-    return MockMongoDatabase()
+    yield _database_pool
+    _database_pool.reset()
+
+
+@pytest.fixture(scope="session")
+def candidate_factory():
+    """Fresh, mutable candidate documents for the first n SOURCED_CANDIDATES"""
+    def make(n: int, **overrides) -> list:
+        return [{**asdict(candidate), **overrides} for candidate in SOURCED_CANDIDATES[:n]]
+    return make
+
+
+@pytest.fixture
+def scraping_agent():
+    """Fresh ProfileScrapingAgent per test, with rate limiting and retry waits disabled"""
+    agent = ProfileScrapingAgent()
+    agent.config.update(rate_limit_delay=0, retry_delay=0)
+    return agent
+
+
+# ==================== TEST DATA ====================
+
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    """Sourced candidate as returned by the (mocked) search"""
+    linkedin_url: str
+    naam: str
+    email: str
+    provider_id: str
+    current_position: str
+    skills: Tuple[str, ...]
+    suitability_score: int
+    skills_joined: str = ""
+
+
+# Built once at import; scores cycle through 78-97 so some fall below the cut-off
+_SOURCED_SKILLS = ("Python", "Django")
+SOURCED_CANDIDATES: Tuple[Candidate, ...] = tuple(
+    Candidate(
+        linkedin_url=f"https://linkedin.com/in/candidate-{i}",
+        naam=f"Candidate {i}",
+        email=f"candidate{i}@example.com",
+        provider_id=f"candidate-{i}",
+        current_position="Python Developer",
+        skills=_SOURCED_SKILLS,
+        suitability_score=78 + (i * 7) % 20,
+        skills_joined=", ".join(_SOURCED_SKILLS)
+    )
+    for i in range(1000)
+)
+
+
+OUTREACH_SUBJECT = "Exciting Opportunity: Python Developer at TechCorp"
+
+OUTREACH_BODY_TEMPLATE = """Hi {naam},
+
+I came across your profile and was impressed by your experience as a {current_position}.
+
+We have an exciting opportunity for a Python Developer at TechCorp in Amsterdam, and I think you'd be a great fit.
+
+Your skills in {skills_joined} align perfectly with what we're looking for.
+
+Would you be open to a quick call to discuss this opportunity?
+
+Best regards,
+Carlos"""
+
+ENRICHED_OUTREACH_SUBJECT_TEMPLATE = "Senior Backend Opportunity at TechCorp - Perfect fit for your {current_position} experience"
+
+ENRICHED_OUTREACH_BODY_TEMPLATE = """Hi {full_name},
+
+I hope this message finds you well! I came across your LinkedIn profile and was genuinely impressed by your career trajectory.
+
+Your experience at {recent_company} as a {current_position}, combined with your {years_exp}+ years in software development, really caught my attention. Your expertise in {top_skills} is exactly what we're looking for.
+
+I noticed you have certifications in {certifications} - that shows real dedication to staying current with industry best practices.
+
+We're building a world-class backend team at TechCorp in Amsterdam, and I believe you'd be an excellent fit for our Senior Python Engineer position. The role involves:
+
+- Architecting scalable microservices
+- Leading a team of talented engineers
+- Working with cutting-edge technologies
+- Competitive compensation package
+
+Would you be open to a brief call this week to explore this opportunity?
+
+Looking forward to hearing from you!
+
+Best regards,
+Carlos Almeida
+Senior Tech Recruiter
+TechCorp"""
+
+ENRICHED_CONNECTION_NOTE_TEMPLATE = (
+    "Hi {full_name}, I just sent you an email about an exciting Senior Python Engineer opportunity at TechCorp. "
+    "Your experience with {top_skills} makes you a perfect fit. Would love to connect and discuss further!"
+)
 
 
 # ==================== UNIT TESTS - EMAIL ====================
@@ -137,36 +335,20 @@ def database():
 class TestEmailOutreachWithMocks:
     """Unit tests for Email Outreach Agent with mock SMTP"""
     
-    def test_send_single_email(self, email_service):
-        """Test sending a single email"""
-        result = email_service.send_email(
-            to="john@example.com",
-            subject="Opportunity at TechCorp",
-            body="Hi John, we have an opportunity for you..."
-        )
+    @pytest.mark.parametrize("to,subject,body", [
+        ("john@example.com", "Opportunity at TechCorp", "Hi John, we have an opportunity for you..."),
+        ("alice@example.com", "Opportunity 2", "Test body"),
+        ("bob@example.com", "Opportunity 3", "Test body")
+    ])
+    def test_send_email(self, email_service, to, subject, body):
+        """Test sending an email"""
+        result = email_service.send_email(to=to, subject=subject, body=body)
         
         assert result["status"] == "success"
         assert len(email_service.sent_emails) == 1
-        assert email_service.sent_emails[0]["to"] == "john@example.com"
-        print("✅ Single email test passed")
-    
-    def test_send_multiple_emails(self, email_service):
-        """Test sending multiple emails"""
-        emails = [
-            ("john@example.com", "Opportunity 1"),
-            ("alice@example.com", "Opportunity 2"),
-            ("bob@example.com", "Opportunity 3")
-        ]
-        
-        for email, subject in emails:
-            email_service.send_email(
-                to=email,
-                subject=subject,
-                body="Test body"
-            )
-        
-        assert len(email_service.sent_emails) == 3
-        print("✅ Multiple emails test passed")
+        assert email_service.sent_emails[0].to == to
+        assert email_service.sent_emails[0].timestamp == FROZEN_NOW_ISO
+        log.debug("✅ Send email test passed")
     
     def test_email_with_personalization(self, email_service):
         """Test email with candidate personalization"""
@@ -192,8 +374,8 @@ Carlos"""
         )
         
         assert result["status"] == "success"
-        assert candidate['name'] in email_service.sent_emails[0]["body"]
-        print("✅ Personalized email test passed")
+        assert candidate['name'] in email_service.sent_emails[0].body
+        log.debug("✅ Personalized email test passed")
 
 
 # ==================== UNIT TESTS - LINKEDIN ====================
@@ -201,48 +383,24 @@ Carlos"""
 class TestLinkedInOutreachWithMocks:
     """Unit tests for LinkedIn Outreach Agent with mock API"""
     
-    def test_send_connection_request(self, linkedin_api):
-        """Test sending connection request"""
-        result = linkedin_api.send_connection_request(
-            provider_id="john-123",
-            message="Hi John, I'd like to connect!"
-        )
-        
-        assert result["status"] == "success"
-        assert result["action"] == "connection_request"
+    @pytest.mark.parametrize("method,kwargs,expected_action", [
+        ("send_connection_request", {"provider_id": "john-123", "message": "Hi John, I'd like to connect!"}, "connection_request"),
+        ("send_message", {"provider_id": "john-123", "message": "Hi John, I have an opportunity for you..."}, "direct_message"),
+        ("send_inmail", {
+            "provider_id": "john-123",
+            "subject": "Exclusive opportunity at TechCorp",
+            "body": "Hi John, we'd like to discuss an exclusive opportunity..."
+        }, "inmail"),
+        ("like_post", {"post_id": "post-456"}, "post_like")
+    ])
+    def test_linkedin_action(self, linkedin_api, method, kwargs, expected_action):
+        """Test each single LinkedIn action"""
+        result = getattr(linkedin_api, method)(**kwargs)
+        
+        assert result.status == "success"
+        assert result.action == expected_action
         assert len(linkedin_api.actions) == 1
-        print("✅ Connection request test passed")
-    
-    def test_send_linkedin_message(self, linkedin_api):
-        """Test sending direct LinkedIn message"""
-        result = linkedin_api.send_message(
-            provider_id="john-123",
-            message="Hi John, I have an opportunity for you..."
-        )
-        
-        assert result["status"] == "success"
-        assert result["action"] == "direct_message"
-        print("✅ LinkedIn message test passed")
-    
-    def test_send_inmail(self, linkedin_api):
-        """Test sending InMail"""
-        result = linkedin_api.send_inmail(
-            provider_id="john-123",
-            subject="Exclusive opportunity at TechCorp",
-            body="Hi John, we'd like to discuss an exclusive opportunity..."
-        )
-        
-        assert result["status"] == "success"
-        assert result["action"] == "inmail"
-        print("✅ InMail test passed")
-    
-    def test_like_post(self, linkedin_api):
-        """Test liking a candidate's post"""
-        result = linkedin_api.like_post(post_id="post-456")
-        
-        assert result["status"] == "success"
-        assert result["action"] == "post_like"
-        print("✅ Post like test passed")
+        log.debug(f"✅ LinkedIn {expected_action} test passed")
     
     def test_multiple_linkedin_actions(self, linkedin_api):
         """Test multiple LinkedIn actions in sequence"""
@@ -262,10 +420,10 @@ class TestLinkedInOutreachWithMocks:
         )
         
         assert len(linkedin_api.actions) == 3
-        assert linkedin_api.actions[0]["action"] == "post_like"
-        assert linkedin_api.actions[1]["action"] == "connection_request"
-        assert linkedin_api.actions[2]["action"] == "direct_message"
-        print("✅ Multiple LinkedIn actions test passed")
+        assert linkedin_api.actions[0].action == "post_like"
+        assert linkedin_api.actions[1].action == "connection_request"
+        assert linkedin_api.actions[2].action == "direct_message"
+        log.debug("✅ Multiple LinkedIn actions test passed")
 
 
 # ==================== UNIT TESTS - DATABASE ====================
@@ -288,7 +446,7 @@ class TestDatabaseWithMocks:
         
         assert result["status"] == "success"
         assert len(database.candidates) == 1
-        print("✅ Save candidate test passed")
+        log.debug("✅ Save candidate test passed")
     
     def test_save_duplicate_candidate(self, database):
         """Test saving duplicate candidate (should update)"""
@@ -312,7 +470,26 @@ class TestDatabaseWithMocks:
         # Should only have 1 record (updated)
         assert len(database.candidates) == 1
         assert database.candidates["https://linkedin.com/in/johndoe"]["suitability_score"] == 90
-        print("✅ Duplicate candidate handling test passed")
+        log.debug("✅ Duplicate candidate handling test passed")
+    
+    def test_save_candidates_batch(self, database):
+        """Test saving and updating several candidates in one call"""
+        candidates = [
+            {"linkedin_url": "https://linkedin.com/in/johndoe", "naam": "John Doe", "suitability_score": 85},
+            {"linkedin_url": "https://linkedin.com/in/alice", "naam": "Alice Johnson", "suitability_score": 90}
+        ]
+        
+        result = database.save_candidates(candidates)
+        assert result["inserted_count"] == 2
+        
+        result = database.update_candidates({
+            "https://linkedin.com/in/alice": {"suitability_score": 70},
+            "https://linkedin.com/in/unknown": {"suitability_score": 99}
+        })
+        assert result["modified_count"] == 1
+        assert database.candidates["https://linkedin.com/in/alice"]["suitability_score"] == 70
+        assert [c["naam"] for c in database.find_by_min_score(80)] == ["John Doe"]
+        log.debug("✅ Batch save candidates test passed")
     
     def test_update_candidate_contact_status(self, database):
         """Test updating candidate contact status"""
@@ -329,12 +506,26 @@ class TestDatabaseWithMocks:
         # Update contact status
         result = database.update_candidate(
             "https://linkedin.com/in/johndoe",
-            {"email_contacted": True, "email_date": datetime.now(timezone.utc).isoformat()}
+            {"email_contacted": True, "email_date": FROZEN_NOW_ISO}
         )
         
         assert result["status"] == "success"
         assert database.candidates["https://linkedin.com/in/johndoe"]["email_contacted"] == True
-        print("✅ Update contact status test passed")
+        log.debug("✅ Update contact status test passed")
+    
+    def test_mark_candidate_contacted(self, database):
+        """Test flagging contact moments through the typed helpers"""
+        database.save_candidate({"linkedin_url": "https://linkedin.com/in/johndoe", "naam": "John Doe"})
+        
+        assert database.mark_email_sent("https://linkedin.com/in/johndoe")["modified_count"] == 1
+        assert database.mark_connection_requested("https://linkedin.com/in/johndoe")["modified_count"] == 1
+        assert database.mark_email_sent("https://linkedin.com/in/unknown")["status"] == "error"
+        
+        candidate = database.candidates["https://linkedin.com/in/johndoe"]
+        assert candidate["email_contacted"] is True
+        assert candidate["email_date"] == FROZEN_NOW_ISO
+        assert candidate["connectie_verzoek"] is True
+        log.debug("✅ Mark candidate contacted test passed")
 
 
 # ==================== INTEGRATION TESTS ====================
@@ -342,26 +533,11 @@ class TestDatabaseWithMocks:
 class TestEmailOutreachFlow:
     """Integration test for Email Outreach workflow"""
     
-    def test_email_outreach_campaign(self, email_service, database):
+    def test_email_outreach_campaign(self, email_service, database, candidate_factory):
         """Test complete email outreach campaign"""
         
         # Test data
-        candidates = [
-            {
-                "linkedin_url": "https://linkedin.com/in/john",
-                "naam": "John Doe",
-                "email": "john@example.com",
-                "current_position": "Python Developer",
-                "suitability_score": 85
-            },
-            {
-                "linkedin_url": "https://linkedin.com/in/alice",
-                "naam": "Alice Johnson",
-                "email": "alice@example.com",
-                "current_position": "Senior Python Developer",
-                "suitability_score": 90
-            }
-        ]
+        candidates = candidate_factory(2)
         
         project_info = {
             "projectid": "PROJ-001",
@@ -370,8 +546,7 @@ class TestEmailOutreachFlow:
         }
         
         # Step 1: Save candidates to database
-        for candidate in candidates:
-            database.save_candidate(candidate)
+        database.save_candidates(candidates)
         
         assert len(database.candidates) == 2
         
@@ -386,51 +561,35 @@ class TestEmailOutreachFlow:
         assert len(email_service.sent_emails) == 2
         
         # Step 3: Update database with email status
-        for candidate in candidates:
-            database.update_candidate(
-                candidate["linkedin_url"],
-                {
-                    "email_contacted": True,
-                    "email_date": datetime.now(timezone.utc).isoformat(),
-                    "projectid": project_info["projectid"],
-                    "campaign_num": project_info["campaign_num"]
-                }
-            )
+        result = database.update_candidates({
+            candidate["linkedin_url"]: {
+                "email_contacted": True,
+                "email_date": FROZEN_NOW_ISO,
+                "projectid": project_info["projectid"],
+                "campaign_num": project_info["campaign_num"]
+            }
+            for candidate in candidates
+        })
+        assert result["modified_count"] == 2
         
         # Verify all emails updated
         all_candidates = database.get_candidates()
         assert all(c.get("email_contacted") for c in all_candidates)
         
-        print("✅ Email campaign flow test passed")
+        log.debug("✅ Email campaign flow test passed")
 
 
 class TestLinkedInOutreachFlow:
     """Integration test for LinkedIn Outreach workflow"""
     
-    def test_linkedin_multi_channel_campaign(self, linkedin_api, database):
+    def test_linkedin_multi_channel_campaign(self, linkedin_api, database, candidate_factory):
         """Test complete LinkedIn multi-channel outreach"""
         
-        candidates = [
-            {
-                "linkedin_url": "https://linkedin.com/in/john",
-                "naam": "John Doe",
-                "provider_id": "john-123",
-                "current_position": "Python Developer",
-                "suitability_score": 85
-            },
-            {
-                "linkedin_url": "https://linkedin.com/in/alice",
-                "naam": "Alice Johnson",
-                "provider_id": "alice-456",
-                "current_position": "Senior Python Developer",
-                "suitability_score": 90,
-                "post_id": "post-789"
-            }
-        ]
+        candidates = candidate_factory(2)
+        candidates[1]["post_id"] = "post-789"
         
         # Step 1: Save candidates
-        for candidate in candidates:
-            database.save_candidate(candidate)
+        database.save_candidates(candidates)
         
         # Step 2: Execute multi-channel outreach
         for candidate in candidates:
@@ -454,111 +613,70 @@ class TestLinkedInOutreachFlow:
         assert len(linkedin_api.actions) == 5  # 1 like + 2 per candidate (2*2)
         
         # Update database
-        for candidate in candidates:
-            database.update_candidate(
-                candidate["linkedin_url"],
-                {
+        database.update_candidates({
+            candidate["linkedin_url"]: {
+                "connectie_verzoek": True,
+                "linkedin_bericht": True,
+                "contactmomenten": {
                     "connectie_verzoek": True,
-                    "linkedin_bericht": True,
-                    "contactmomenten": {
-                        "connectie_verzoek": True,
-                        "linkedin_bericht": True
-                    }
+                    "linkedin_bericht": True
                 }
-            )
+            }
+            for candidate in candidates
+        })
         
         all_candidates = database.get_candidates()
         assert all(c.get("connectie_verzoek") for c in all_candidates)
         
-        print("✅ LinkedIn multi-channel campaign test passed")
+        log.debug("✅ LinkedIn multi-channel campaign test passed")
 
 
 # ==================== END-TO-END INTEGRATION TEST ====================
 
+@pytest.mark.xdist_group(name="e2e_heavy")
 class TestCompleteRecruitmentFlow:
     """Integration test for complete end-to-end recruitment"""
     
-    def test_complete_sourcing_to_outreach_flow(self, email_service, linkedin_api, database):
-        """Test complete flow from sourcing to outreach"""
+    @pytest.mark.parametrize("n", [10, 100, 1000])
+    def test_complete_sourcing_to_outreach_flow(self, email_service, linkedin_api, database, candidate_factory, n):
+        """Test complete flow from sourcing to outreach for n sourced candidates"""
         
         # ========== STAGE 1: SOURCING ==========
-        print("\n[STAGE 1] Sourcing candidates...")
+        log.debug("\n[STAGE 1] Sourcing candidates...")
         
-        sourced_candidates = [
-            {
-                "linkedin_url": "https://linkedin.com/in/john",
-                "naam": "John Doe",
-                "email": "john@example.com",
-                "provider_id": "john-123",
-                "current_position": "Python Developer",
-                "skills": ["Python", "Django"],
-                "suitability_score": 85
-            },
-            {
-                "linkedin_url": "https://linkedin.com/in/alice",
-                "naam": "Alice Johnson",
-                "email": "alice@example.com",
-                "provider_id": "alice-456",
-                "current_position": "Senior Python Developer",
-                "skills": ["Python", "Django", "FastAPI"],
-                "suitability_score": 92
-            },
-            {
-                "linkedin_url": "https://linkedin.com/in/bob",
-                "naam": "Bob Smith",
-                "email": "bob@example.com",
-                "provider_id": "bob-789",
-                "current_position": "Python Developer",
-                "skills": ["Python", "Flask"],
-                "suitability_score": 78
-            }
-        ]
+        sourced_candidates = SOURCED_CANDIDATES[:n]
+        expected_suitable = sum(1 for c in sourced_candidates if c.suitability_score >= 80)
         
-        # Save sourced candidates to database
-        for candidate in sourced_candidates:
-            database.save_candidate(candidate)
+        # Save sourced candidates to database; the stored documents are mutable copies
+        database.save_candidates(candidate_factory(n))
         
-        print(f"✅ Sourced {len(sourced_candidates)} candidates")
-        assert len(database.candidates) == 3
+        log.debug(f"✅ Sourced {len(sourced_candidates)} candidates")
+        assert len(database.candidates) == n
         
         # ========== STAGE 2: EVALUATION ==========
-        print("[STAGE 2] Evaluating candidates...")
+        log.debug("[STAGE 2] Evaluating candidates...")
         
-        suitable_candidates = [c for c in sourced_candidates if c["suitability_score"] >= 80]
-        print(f"✅ {len(suitable_candidates)} suitable candidates")
-        assert len(suitable_candidates) == 2
+        suitable_candidates = database.find_by_min_score(80)
+        log.debug(f"✅ {len(suitable_candidates)} suitable candidates")
+        assert 0 < len(suitable_candidates) == expected_suitable < n
         
         # ========== STAGE 3: EMAIL OUTREACH ==========
-        print("[STAGE 3] Email outreach...")
+        log.debug("[STAGE 3] Email outreach...")
         
         for candidate in suitable_candidates:
             email_service.send_email(
                 to=candidate["email"],
-                subject=f"Exciting Opportunity: Python Developer at TechCorp",
-                body=f"""Hi {candidate['naam']},
-
-I came across your profile and was impressed by your experience as a {candidate['current_position']}.
-
-We have an exciting opportunity for a Python Developer at TechCorp in Amsterdam, and I think you'd be a great fit.
-
-Your skills in {', '.join(candidate['skills'])} align perfectly with what we're looking for.
-
-Would you be open to a quick call to discuss this opportunity?
-
-Best regards,
-Carlos"""
-            )
-            
-            database.update_candidate(
-                candidate["linkedin_url"],
-                {"email_contacted": True, "email_date": datetime.now(timezone.utc).isoformat()}
+                subject=OUTREACH_SUBJECT,
+                body=OUTREACH_BODY_TEMPLATE.format_map(candidate)
             )
+            database.mark_email_sent(candidate["linkedin_url"])
         
-        print(f"✅ Sent {len(email_service.sent_emails)} emails")
-        assert len(email_service.sent_emails) == 2
+        log.debug(f"✅ Sent {len(email_service.sent_emails)} emails")
+        assert len(email_service.sent_emails) == expected_suitable
+        assert all("Python, Django" in email.body for email in email_service.sent_emails)
         
         # ========== STAGE 4: LINKEDIN OUTREACH ==========
-        print("[STAGE 4] LinkedIn outreach...")
+        log.debug("[STAGE 4] LinkedIn outreach...")
         
         for candidate in suitable_candidates:
             # Send connection request
@@ -566,47 +684,113 @@ Carlos"""
                 provider_id=candidate["provider_id"],
                 message=f"Hi {candidate['naam']}, following up on the email I sent. Would love to connect!"
             )
-            
-            database.update_candidate(
-                candidate["linkedin_url"],
-                {"connectie_verzoek": True}
-            )
+            database.mark_connection_requested(candidate["linkedin_url"])
         
-        connection_requests = len([a for a in linkedin_api.actions if a['action'] == 'connection_request'])
-        print(f"✅ Sent {connection_requests} connection requests")
-        assert connection_requests == 2
+        connection_requests = linkedin_api.count("connection_request")
+        log.debug(f"✅ Sent {connection_requests} connection requests")
+        assert connection_requests == expected_suitable
         
         # ========== VERIFICATION ==========
-        print("\n[VERIFICATION] Checking results...")
+        log.debug("\n[VERIFICATION] Checking results...")
         
-        all_candidates = database.get_candidates()
+        all_candidates = database.get_candidates(limit=n)
         contacted_candidates = [c for c in all_candidates if c.get("email_contacted") or c.get("connectie_verzoek")]
         
-        assert len(all_candidates) == 3
-        assert len(contacted_candidates) >= 2
-        assert len(email_service.sent_emails) == 2
-        assert len(linkedin_api.actions) == 2
+        assert len(all_candidates) == n
+        assert len(contacted_candidates) == expected_suitable
+        assert len(email_service.sent_emails) == expected_suitable
+        assert len(linkedin_api.actions) == expected_suitable
         
-        print(f"""
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"""
 ✅ COMPLETE FLOW SUCCESS!
 - Total candidates sourced: {len(all_candidates)}
 - Suitable candidates: {len(suitable_candidates)}
 - Contacted: {len(contacted_candidates)}
 - Emails sent: {len(email_service.sent_emails)}
 - LinkedIn actions: {len(linkedin_api.actions)}
-        """)
+            """)
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
+# ==================== END-TO-END TEST WITH PROFILE SCRAPING ====================
+
+# Scraped profiles served by the patched LinkedIn_profile_scrape, keyed by profile URL
+MOCK_ENRICHED_DATA = {
+    "https://linkedin.com/in/johndoe": {
+        "work_experience": [
+            {
+                "company": "StartupCo",
+                "position": "Python Developer",
+                "duration": "2022-Present",
+                "description": "Backend development with Django"
+            },
+            {
+                "company": "CodeCorp",
+                "position": "Junior Developer", 
+                "duration": "2020-2022",
+                "description": "Full-stack development"
+            }
+        ],
+        "education": [
+            {
+                "institution": "University of Amsterdam",
+                "degree": "BSc Computer Science",
+                "year": "2020"
+            }
+        ],
+        "skills": ["Python", "AWS", "Docker", "PostgreSQL", "Redis"],
+        "certifications": ["AWS Certified Developer"],
+        "languages": ["English", "Dutch"],
+        "endorsements": {"Python": 45, "AWS": 23},
+        "summary": "Passionate backend developer with 4+ years of experience",
+        "headline": "Python Developer | AWS | Backend Specialist",
+        "connections_count": 450
+    },
+    "https://linkedin.com/in/alicesmith": {
+        "work_experience": [
+            {
+                "company": "TechGiant",
+                "position": "Senior Python Developer",
+                "duration": "2020-Present",
+                "description": "Leading backend team, architecting microservices"
+            },
+            {
+                "company": "FinTech Inc",
+                "position": "Python Developer",
+                "duration": "2017-2020",
+                "description": "Payment systems development"
+            }
+        ],
+        "education": [
+            {
+                "institution": "TU Delft",
+                "degree": "MSc Computer Science",
+                "year": "2017"
+            }
+        ],
+        "skills": ["Python", "Django", "FastAPI", "Kubernetes", "Microservices", "PostgreSQL"],
+        "certifications": ["AWS Solutions Architect", "Google Cloud Professional"],
+        "languages": ["English", "Dutch", "German"],
+        "endorsements": {"Python": 89, "Django": 67, "FastAPI": 34},
+        "summary": "Senior engineer specializing in scalable backend systems",
+        "headline": "Senior Python Engineer | Microservices Architect",
+        "connections_count": 850
+    }
+}
 
+# Tool responses (JSON strings, like the real tool) encoded once from the profiles above
+MOCK_SCRAPE_RESPONSES = {
+    url: json.dumps({"success": True, "profile_data": profile_data})
+    for url, profile_data in MOCK_ENRICHED_DATA.items()
+}
+MOCK_SCRAPE_NOT_FOUND = json.dumps({"success": False, "error": "Profile not found"})
 
-# ==================== END-TO-END TEST WITH PROFILE SCRAPING ====================
 
+@pytest.mark.xdist_group(name="e2e_enrichment")
 class TestCompleteRecruitmentFlowWithProfileScraping:
     """End-to-end test including Profile Scraping Agent"""
     
-    def test_full_recruitment_pipeline_with_enrichment(self, email_service, linkedin_api, database):
+    def test_full_recruitment_pipeline_with_enrichment(self, email_service, linkedin_api, database, scraping_agent, patched_scrape):
         """
         Complete recruitment pipeline test:
         1. Candidate Searching (mock LinkedIn search)
@@ -616,12 +800,12 @@ class TestCompleteRecruitmentFlowWithProfileScraping:
         5. Multi-channel Outreach
         6. Database persistence
         """
-        print("\n" + "="*70)
-        print("COMPLETE RECRUITMENT PIPELINE WITH PROFILE SCRAPING")
-        print("="*70)
+        log.debug("\n" + "="*70)
+        log.debug("COMPLETE RECRUITMENT PIPELINE WITH PROFILE SCRAPING")
+        log.debug("="*70)
         
         # ========== STAGE 1: CANDIDATE SEARCHING ==========
-        print("\n[STAGE 1] Searching for candidates...")
+        log.debug("\n[STAGE 1] Searching for candidates...")
         
         initial_candidates = [
             {
@@ -656,132 +840,57 @@ class TestCompleteRecruitmentFlowWithProfileScraping:
             }
         ]
         
-        print(f"✅ Found {len(initial_candidates)} initial candidates")
+        log.debug(f"✅ Found {len(initial_candidates)} initial candidates")
         
         # ========== STAGE 2: INITIAL EVALUATION ==========
-        print("\n[STAGE 2] Initial candidate evaluation...")
+        log.debug("\n[STAGE 2] Initial candidate evaluation...")
         
         high_potential = [c for c in initial_candidates if c["suitability_score"] >= 80]
-        print(f"✅ Identified {len(high_potential)} high-potential candidates for enrichment")
+        log.debug(f"✅ Identified {len(high_potential)} high-potential candidates for enrichment")
         assert len(high_potential) == 2
         
         # ========== STAGE 3: PROFILE SCRAPING (ENRICHMENT) ==========
-        print("\n[STAGE 3] Deep profile scraping for high-potential candidates...")
-        
-        from sub_agents.profile_scraping_agent import ProfileScrapingAgent
-        
-        # Mock enriched profile data
-        mock_enriched_data = {
-            "https://linkedin.com/in/johndoe": {
-                "work_experience": [
-                    {
-                        "company": "StartupCo",
-                        "position": "Python Developer",
-                        "duration": "2022-Present",
-                        "description": "Backend development with Django"
-                    },
-                    {
-                        "company": "CodeCorp",
-                        "position": "Junior Developer", 
-                        "duration": "2020-2022",
-                        "description": "Full-stack development"
-                    }
-                ],
-                "education": [
-                    {
-                        "institution": "University of Amsterdam",
-                        "degree": "BSc Computer Science",
-                        "year": "2020"
-                    }
-                ],
-                "skills": ["Python", "AWS", "Docker", "PostgreSQL", "Redis"],
-                "certifications": ["AWS Certified Developer"],
-                "languages": ["English", "Dutch"],
-                "endorsements": {"Python": 45, "AWS": 23},
-                "summary": "Passionate backend developer with 4+ years of experience",
-                "headline": "Python Developer | AWS | Backend Specialist",
-                "connections_count": 450
-            },
-            "https://linkedin.com/in/alicesmith": {
-                "work_experience": [
-                    {
-                        "company": "TechGiant",
-                        "position": "Senior Python Developer",
-                        "duration": "2020-Present",
-                        "description": "Leading backend team, architecting microservices"
-                    },
-                    {
-                        "company": "FinTech Inc",
-                        "position": "Python Developer",
-                        "duration": "2017-2020",
-                        "description": "Payment systems development"
-                    }
-                ],
-                "education": [
-                    {
-                        "institution": "TU Delft",
-                        "degree": "MSc Computer Science",
-                        "year": "2017"
-                    }
-                ],
-                "skills": ["Python", "Django", "FastAPI", "Kubernetes", "Microservices", "PostgreSQL"],
-                "certifications": ["AWS Solutions Architect", "Google Cloud Professional"],
-                "languages": ["English", "Dutch", "German"],
-                "endorsements": {"Python": 89, "Django": 67, "FastAPI": 34},
-                "summary": "Senior engineer specializing in scalable backend systems",
-                "headline": "Senior Python Engineer | Microservices Architect",
-                "connections_count": 850
-            }
-        }
+        log.debug("\n[STAGE 3] Deep profile scraping for high-potential candidates...")
         
         # Mock the LinkedIn profile scraping
-        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
-            def mock_scrape_invoke(input_dict):
-                url = input_dict.get("linkedin_url")
-                if url in mock_enriched_data:
-                    return json.dumps({
-                        "success": True,
-                        "profile_data": mock_enriched_data[url]
-                    })
-                return json.dumps({"success": False, "error": "Profile not found"})
-            
-            mock_scrape.invoke.side_effect = mock_scrape_invoke
-            
-            # Create ProfileScrapingAgent and enrich
-            scraping_agent = ProfileScrapingAgent()
-            
-            enrichment_request = {
-                "candidates": high_potential,
-                "projectid": "PROJ-E2E-001",
-                "naam_project": "Backend Team Expansion E2E",
-                "campaign_num": "CAMP-E2E-001",
-                "search_id": "SEARCH-E2E-001"
-            }
-            
-            enrichment_result = scraping_agent.enrich_candidates(enrichment_request)
-            
-            assert enrichment_result["success"] is True
-            assert len(enrichment_result["enriched_candidates"]) == 2
-            assert enrichment_result["enrichment_stats"]["success_count"] == 2
-            assert enrichment_result["enrichment_stats"]["failed_count"] == 0
-            
-            enriched_candidates = enrichment_result["enriched_candidates"]
-            
-            print(f"✅ Successfully enriched {len(enriched_candidates)} profiles")
-            
-            # Verify enrichment data
-            for candidate in enriched_candidates:
-                assert "work_experience" in candidate
-                assert "education" in candidate
-                assert "certifications" in candidate
-                assert len(candidate["skills"]) > len(high_potential[0]["skills"])
-                print(f"   - {candidate['full_name']}: {len(candidate['work_experience'])} jobs, "
-                      f"{len(candidate['skills'])} skills, {len(candidate.get('certifications', []))} certs")
+        patched_scrape.invoke.side_effect = lambda input_dict: MOCK_SCRAPE_RESPONSES.get(
+            input_dict.get("linkedin_url"), MOCK_SCRAPE_NOT_FOUND
+        )
+        
+        # Enrich with the module's ProfileScrapingAgent
+        enrichment_request = {
+            "candidates": high_potential,
+            "projectid": "PROJ-E2E-001",
+            "naam_project": "Backend Team Expansion E2E",
+            "campaign_num": "CAMP-E2E-001",
+            "search_id": "SEARCH-E2E-001"
+        }
+        
+        enrichment_result = scraping_agent.enrich_candidates(enrichment_request)
+        
+        assert enrichment_result["success"] is True
+        assert len(enrichment_result["enriched_candidates"]) == 2
+        assert enrichment_result["enrichment_stats"]["success_count"] == 2
+        assert enrichment_result["enrichment_stats"]["failed_count"] == 0
+        
+        enriched_candidates = enrichment_result["enriched_candidates"]
+        
+        log.debug(f"✅ Successfully enriched {len(enriched_candidates)} profiles")
+        
+        # Verify enrichment data
+        for candidate in enriched_candidates:
+            assert "work_experience" in candidate
+            assert "education" in candidate
+            assert "certifications" in candidate
+            assert len(candidate["skills"]) > len(high_potential[0]["skills"])
+            log.debug(f"   - {candidate['full_name']}: {len(candidate['work_experience'])} jobs, "
+                  f"{len(candidate['skills'])} skills, {len(candidate.get('certifications', []))} certs")
         
         # ========== STAGE 4: ENHANCED EVALUATION ==========
-        print("\n[STAGE 4] Re-evaluation with enriched data...")
+        log.debug("\n[STAGE 4] Re-evaluation with enriched data...")
         
-        # Recalculate suitability with enriched data
+        # Recalculate suitability with enriched data, selecting final candidates in the same pass
+        final_candidates = []
         for candidate in enriched_candidates:
             base_score = candidate["suitability_score"]
             
@@ -792,28 +901,27 @@ class TestCompleteRecruitmentFlowWithProfileScraping:
             
             new_score = min(base_score + experience_boost + cert_boost + skills_boost, 100)
             candidate["enhanced_suitability_score"] = new_score
+            if new_score >= 90:
+                final_candidates.append(candidate)
             
-            print(f"   - {candidate['full_name']}: {base_score} → {new_score} "
+            log.debug(f"   - {candidate['full_name']}: {base_score} → {new_score} "
                   f"(+{new_score - base_score} from enrichment)")
         
-        # Select final candidates
-        final_candidates = [c for c in enriched_candidates if c["enhanced_suitability_score"] >= 90]
-        print(f"✅ {len(final_candidates)} candidates meet enhanced criteria")
+        log.debug(f"✅ {len(final_candidates)} candidates meet enhanced criteria")
         
         # ========== STAGE 5: DATABASE PERSISTENCE ==========
-        print("\n[STAGE 5] Saving enriched profiles to database...")
+        log.debug("\n[STAGE 5] Saving enriched profiles to database...")
         
-        for candidate in enriched_candidates:
-            database.save_candidate(candidate)
+        database.save_candidates(enriched_candidates)
         
         # Also save the lower-scoring candidate
         database.save_candidate(initial_candidates[2])
         
-        print(f"✅ Saved {len(database.candidates)} candidates to database")
+        log.debug(f"✅ Saved {len(database.candidates)} candidates to database")
         assert len(database.candidates) == 3
         
         # ========== STAGE 6: PERSONALIZED OUTREACH ==========
-        print("\n[STAGE 6] Personalized multi-channel outreach...")
+        log.debug("\n[STAGE 6] Personalized multi-channel outreach...")
         
         for candidate in final_candidates:
             # Generate highly personalized email using enriched data
@@ -821,64 +929,53 @@ class TestCompleteRecruitmentFlowWithProfileScraping:
             years_exp = len(candidate.get("work_experience", []))
             top_skills = ", ".join(candidate["skills"][:3])
             
-            email_body = f"""Hi {candidate['full_name']},
-
-I hope this message finds you well! I came across your LinkedIn profile and was genuinely impressed by your career trajectory.
-
-Your experience at {recent_company} as a {candidate['current_position']}, combined with your {years_exp}+ years in software development, really caught my attention. Your expertise in {top_skills} is exactly what we're looking for.
-
-I noticed you have certifications in {', '.join(candidate.get('certifications', ['relevant areas']))} - that shows real dedication to staying current with industry best practices.
-
-We're building a world-class backend team at TechCorp in Amsterdam, and I believe you'd be an excellent fit for our Senior Python Engineer position. The role involves:
-
-- Architecting scalable microservices
-- Leading a team of talented engineers
-- Working with cutting-edge technologies
-- Competitive compensation package
-
-Would you be open to a brief call this week to explore this opportunity?
-
-Looking forward to hearing from you!
-
-Best regards,
-Carlos Almeida
-Senior Tech Recruiter
-TechCorp"""
+            email_body = ENRICHED_OUTREACH_BODY_TEMPLATE.format(
+                full_name=candidate["full_name"],
+                recent_company=recent_company,
+                current_position=candidate["current_position"],
+                years_exp=years_exp,
+                top_skills=top_skills,
+                certifications=", ".join(candidate.get("certifications", ["relevant areas"]))
+            )
             
             # Send email
             email_service.send_email(
                 to=candidate["email"],
-                subject=f"Senior Backend Opportunity at TechCorp - Perfect fit for your {candidate['current_position']} experience",
+                subject=ENRICHED_OUTREACH_SUBJECT_TEMPLATE.format(current_position=candidate["current_position"]),
                 body=email_body
             )
             
             # Send LinkedIn connection request with personalized note
-            linkedin_message = f"""Hi {candidate['full_name']}, I just sent you an email about an exciting Senior Python Engineer opportunity at TechCorp. Your experience with {top_skills} makes you a perfect fit. Would love to connect and discuss further!"""
+            linkedin_message = ENRICHED_CONNECTION_NOTE_TEMPLATE.format(
+                full_name=candidate["full_name"],
+                top_skills=top_skills
+            )
             
             linkedin_api.send_connection_request(
                 provider_id=candidate["provider_id"],
                 message=linkedin_message[:300]  # LinkedIn limit
             )
             
-            # Update database
-            database.update_candidate(
-                candidate["linkedin_url"],
-                {
-                    "email_contacted": True,
-                    "email_date": datetime.now(timezone.utc).isoformat(),
-                    "connectie_verzoek": True,
-                    "connection_date": datetime.now(timezone.utc).isoformat(),
-                    "outreach_personalization_level": "high",
-                    "enrichment_used": True
-                }
-            )
-            
-            print(f"   ✅ Contacted {candidate['full_name']} via email + LinkedIn")
+            log.debug(f"   ✅ Contacted {candidate['full_name']} via email + LinkedIn")
+        
+        # Record every outreach in one database call
+        result = database.update_candidates({
+            candidate["linkedin_url"]: {
+                "email_contacted": True,
+                "email_date": FROZEN_NOW_ISO,
+                "connectie_verzoek": True,
+                "connection_date": FROZEN_NOW_ISO,
+                "outreach_personalization_level": "high",
+                "enrichment_used": True
+            }
+            for candidate in final_candidates
+        })
+        assert result["modified_count"] == len(final_candidates)
         
-        print(f"\n✅ Completed outreach to {len(final_candidates)} top candidates")
+        log.debug(f"\n✅ Completed outreach to {len(final_candidates)} top candidates")
         
         # ========== STAGE 7: CAMPAIGN ANALYTICS ==========
-        print("\n[STAGE 7] Campaign analytics and reporting...")
+        log.debug("\n[STAGE 7] Campaign analytics and reporting...")
         
         campaign_stats = {
             "total_searched": len(initial_candidates),
@@ -893,7 +990,8 @@ TechCorp"""
                                         for c in enriched_candidates) / len(enriched_candidates)
         }
         
-        print(f"""
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"""
 {'='*70}
 CAMPAIGN RESULTS SUMMARY
 {'='*70}
@@ -920,7 +1018,7 @@ CAMPAIGN RESULTS SUMMARY
 {'='*70}
 ✅ COMPLETE E2E TEST PASSED!
 {'='*70}
-        """)
+            """)
         
         # ========== FINAL ASSERTIONS ==========
         assert campaign_stats["total_searched"] == 3
@@ -940,18 +1038,16 @@ CAMPAIGN RESULTS SUMMARY
         
         # Verify personalization was applied
         for email in email_service.sent_emails:
-            assert "certifications" in email["body"] or "experience" in email["body"]
-            assert len(email["body"]) > 200  # Detailed personalized message
+            assert "certifications" in email.body or "experience" in email.body
+            assert len(email.body) > 200  # Detailed personalized message
         
-        print("\n✅ All assertions passed! Complete recruitment pipeline working correctly.")
+        log.debug("\n✅ All assertions passed! Complete recruitment pipeline working correctly.")
     
-    def test_profile_scraping_with_failures(self, database):
+    def test_profile_scraping_with_failures(self, database, scraping_agent, patched_scrape):
         """Test profile scraping with some failures in the pipeline"""
-        print("\n" + "="*70)
-        print("PROFILE SCRAPING WITH FAILURE HANDLING")
-        print("="*70)
-        
-        from sub_agents.profile_scraping_agent import ProfileScrapingAgent
+        log.debug("\n" + "="*70)
+        log.debug("PROFILE SCRAPING WITH FAILURE HANDLING")
+        log.debug("="*70)
         
         candidates = [
             {
@@ -970,43 +1066,46 @@ CAMPAIGN RESULTS SUMMARY
             }
         ]
         
-        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
-            def mock_scrape_with_failures(input_dict):
-                url = input_dict.get("linkedin_url")
-                if url == "https://linkedin.com/in/working-profile":
-                    return json.dumps({
-                        "success": True,
-                        "profile_data": {
-                            "work_experience": [{"company": "Test"}],
-                            "education": [],
-                            "skills": ["Python", "Django"]
-                        }
-                    })
-                return json.dumps({"success": False, "error": "Profile not accessible"})
-            
-            mock_scrape.invoke.side_effect = mock_scrape_with_failures
-            
-            agent = ProfileScrapingAgent()
-            result = agent.enrich_candidates({
-                "candidates": candidates,
-                "projectid": "TEST-FAIL"
-            })
-            
-            assert result["success"] is True
-            assert result["enrichment_stats"]["success_count"] == 1
-            assert result["enrichment_stats"]["failed_count"] == 2
-            
-            print(f"✅ Success count: {result['enrichment_stats']['success_count']}")
-            print(f"✅ Failed count: {result['enrichment_stats']['failed_count']}")
-            print(f"✅ Success rate: {result['enrichment_stats']['success_rate']*100:.0f}%")
-            
-            # Verify failed candidates have error messages
-            for failed in result["failed_enrichments"]:
-                assert "enrichment_error" in failed
-                print(f"   - {failed['full_name']}: {failed['enrichment_error']}")
-            
-            print("\n✅ Failure handling test passed!")
+        def mock_scrape_with_failures(input_dict):
+            url = input_dict.get("linkedin_url")
+            if url == "https://linkedin.com/in/working-profile":
+                return json.dumps({
+                    "success": True,
+                    "profile_data": {
+                        "work_experience": [{"company": "Test"}],
+                        "education": [],
+                        "skills": ["Python", "Django"]
+                    }
+                })
+            return json.dumps({"success": False, "error": "Profile not accessible"})
+        
+        patched_scrape.invoke.side_effect = mock_scrape_with_failures
+        
+        result = scraping_agent.enrich_candidates({
+            "candidates": candidates,
+            "projectid": "TEST-FAIL"
+        })
+        
+        assert result["success"] is True
+        assert result["enrichment_stats"]["success_count"] == 1
+        assert result["enrichment_stats"]["failed_count"] == 2
+        # Counts start at zero for every test: one lookup for the working profile, a full
+        # retry ladder for the failing one, none for the candidate without a URL
+        assert patched_scrape.invoke.call_count == 1 + scraping_agent.config["max_retries"]
+        
+        log.debug(f"✅ Success count: {result['enrichment_stats']['success_count']}")
+        log.debug(f"✅ Failed count: {result['enrichment_stats']['failed_count']}")
+        log.debug(f"✅ Success rate: {result['enrichment_stats']['success_rate']*100:.0f}%")
+        
+        # Verify failed candidates have error messages
+        for failed in result["failed_enrichments"]:
+            assert "enrichment_error" in failed
+            log.debug(f"   - {failed['full_name']}: {failed['enrichment_error']}")
+        
+        log.debug("\n✅ Failure handling test passed!")
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    # One worker per core; loadgroup pins each heavy end-to-end class to its own
+    # worker and spreads the fast unit tests over the rest
+    pytest.main([__file__, "-v", "-n", "auto", "--dist=loadgroup"])
\ No newline at end of file
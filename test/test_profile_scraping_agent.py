@@ -7,9 +7,16 @@ Tests cover profile enrichment, caching, error handling, and batch processing.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import json
+import time
+import threading
 from datetime import datetime
 
-from sub_agents.profile_scraping_agent import ProfileScrapingAgent
+from sub_agents.profile_scraping_agent import (
+    ProfileScrapingAgent, ProfileData, _TokenBucket, _cached_company_context,
+    _matching_categories, _substring_categories
+)
+from sub_agents import profile_scraping_agent
+from tools.scourcing_tools import LinkedIn_profile_scrape
 
 
 class TestProfileScrapingAgent:
@@ -172,6 +179,146 @@ class TestProfileScrapingAgent:
             assert result2["enriched_candidates"][0]["enrichment_source"] == "cache"
             assert result2["enriched_candidates"][1]["enrichment_source"] == "cache"
     
+    def test_duplicate_urls_scraped_once(self, agent, sample_candidates, sample_profile_data):
+        """Test that candidates sharing a LinkedIn URL trigger a single scrape."""
+        duplicate = {**sample_candidates[0], "full_name": "Johnny Doe",
+                     "linkedin_url": "https://LinkedIn.com/in/johndoe/?trk=search"}
+        request = {
+            "candidates": [*sample_candidates, duplicate],
+            "projectid": "PROJ-001",
+            "enrichment_config": {"enable_caching": False}
+        }
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = json.dumps({
+                "success": True,
+                "profile_data": sample_profile_data
+            })
+            
+            result = agent.enrich_candidates(request)
+            
+            assert mock_scrape.invoke.call_count == 2
+            assert result["enrichment_stats"]["success_count"] == 3
+            names = {c["full_name"] for c in result["enriched_candidates"]}
+            assert names == {"John Doe", "Jane Smith", "Johnny Doe"}
+    
+    def test_group_candidates_by_url_dedup_stats(self, agent, caplog):
+        """Test URL grouping and that candidates without a URL are not counted as duplicates."""
+        candidates = [
+            {"full_name": "A", "linkedin_url": "https://linkedin.com/in/a"},
+            {"full_name": "A again", "profile_url": "https://www.linkedin.com/in/a/"},
+            {"full_name": "No URL 1"},
+            {"full_name": "No URL 2"},
+        ]
+        
+        with caplog.at_level("INFO", logger="sub_agents.profile_scraping_agent"):
+            groups = agent._group_candidates_by_url(candidates)
+        
+        assert list(groups) == ["https://linkedin.com/in/a", ""]
+        assert [c["full_name"] for c in groups[""]] == ["No URL 1", "No URL 2"]
+        assert "skipping 1 duplicate lookups" in caplog.text
+    
+    def test_url_variants_share_cache_entry(self, agent, sample_profile_data):
+        """Test that cosmetic URL differences hit the same cache entry."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = {"success": True, "profile_data": sample_profile_data}
+            
+            for url in ("https://www.linkedin.com/in/johndoe/",
+                        "http://linkedin.com/in/JohnDoe?utm_source=share",
+                        "linkedin.com/in/johndoe#experience"):
+                result = agent.enrich_candidates({
+                    "candidates": [{"full_name": "John Doe", "linkedin_url": url}],
+                    "projectid": "PROJ-001"
+                })
+                assert result["enrichment_stats"]["success_count"] == 1
+            
+            mock_scrape.invoke.assert_called_once_with({"linkedin_url": "https://linkedin.com/in/johndoe"})
+    
+    def test_persistent_cache_survives_restart(self, sourcing_manager_request, sample_profile_data,
+                                               tmp_path, monkeypatch):
+        """Test that the disk cache serves profiles to a freshly created agent."""
+        pytest.importorskip("diskcache")
+        monkeypatch.setenv("PROFILE_CACHE_DIR", str(tmp_path))
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = json.dumps({
+                "success": True,
+                "profile_data": sample_profile_data
+            })
+            
+            ProfileScrapingAgent().enrich_candidates(sourcing_manager_request)
+            assert mock_scrape.invoke.call_count == 2
+            
+            # A new agent (e.g. after a process restart) reuses the persisted profiles
+            restarted = ProfileScrapingAgent()
+            result = restarted.enrich_candidates(sourcing_manager_request)
+            assert mock_scrape.invoke.call_count == 2
+            assert all(c["enrichment_source"] == "cache" for c in result["enriched_candidates"])
+    
+    def test_persistent_cache_size_from_env(self, tmp_path, monkeypatch):
+        """Test that the disk cache honours PROFILE_CACHE_BYTES."""
+        pytest.importorskip("diskcache")
+        monkeypatch.setenv("PROFILE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("PROFILE_CACHE_BYTES", str(2 ** 20))
+        
+        agent = ProfileScrapingAgent()
+        
+        assert agent._disk_cache.size_limit == 2 ** 20
+        assert agent._disk_cache.eviction_policy == "least-recently-used"
+    
+    def test_cache_entries_expire(self, agent, sample_profile_data):
+        """Test that in-memory cache entries older than the TTL are ignored."""
+        config = {**agent.config, "cache_ttl_seconds": 60}
+        agent._cache_profile("https://linkedin.com/in/johndoe", sample_profile_data, config)
+        
+        assert agent._get_cached_profile("https://linkedin.com/in/johndoe", config) == sample_profile_data
+        
+        with patch('time.monotonic', return_value=time.monotonic() + 61):
+            assert agent._get_cached_profile("https://linkedin.com/in/johndoe", config) is None
+        assert agent.get_cache_size() == 0
+    
+    def test_negative_cache_for_permanent_failures(self, agent, sample_candidates):
+        """Test that not-found profiles are cached as failures but rate limits are not."""
+        request = {"candidates": [sample_candidates[0]], "projectid": "PROJ-001"}
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep'):
+            mock_scrape.invoke.return_value = json.dumps({"success": False, "error": "Profile not found (404)"})
+            
+            agent.enrich_candidates(request)
+            assert mock_scrape.invoke.call_count == agent.config["max_retries"]
+            
+            # The cached failure short-circuits the retry ladder
+            result = agent.enrich_candidates(request)
+            assert mock_scrape.invoke.call_count == agent.config["max_retries"]
+            assert result["failed_enrichments"][0]["enrichment_error"] == "Profile not found (404)"
+        
+        agent.clear_cache()
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep'):
+            mock_scrape.invoke.return_value = json.dumps({"success": False, "error": "Rate limit exceeded (429)"})
+            
+            agent.enrich_candidates(request)
+            agent.enrich_candidates(request)
+            assert mock_scrape.invoke.call_count == 2 * agent.config["max_retries"]
+            assert agent.get_cache_size() == 0
+    
+    def test_memory_cache_is_bounded_lru(self, agent, sample_profile_data):
+        """Test that the in-memory cache evicts the least recently used profile."""
+        config = {**agent.config, "cache_max_size": 2}
+        agent._profile_cache.maxsize = config["cache_max_size"]
+        
+        agent._cache_profile("https://linkedin.com/in/a", sample_profile_data, config)
+        agent._cache_profile("https://linkedin.com/in/b", sample_profile_data, config)
+        
+        # Touch "a" so "b" becomes the eviction candidate
+        assert agent._get_cached_profile("https://linkedin.com/in/a", config) is not None
+        agent._cache_profile("https://linkedin.com/in/c", sample_profile_data, config)
+        
+        assert agent.get_cache_size() == 2
+        assert agent._get_cached_profile("https://linkedin.com/in/b", config) is None
+        assert agent._get_cached_profile("https://linkedin.com/in/a", config) is not None
+    
     def test_cache_clearing(self, agent):
         """Test cache clearing functionality."""
         agent._profile_cache["test_url"] = {"data": "test"}
@@ -225,6 +372,27 @@ class TestProfileScrapingAgent:
             assert result["enrichment_stats"]["failed_count"] == 1
             assert result["failed_enrichments"][0]["enrichment_status"] == "failed"
     
+    def test_retry_backoff_is_exponential_with_jitter(self, agent, sample_profile_data):
+        """Test that retry waits grow exponentially and stretch under repeated 429s."""
+        config = {**agent.config, "max_retries": 4, "retry_delay": 2, "rate_limit_delay": 0}
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('sub_agents.profile_scraping_agent.random.uniform', side_effect=lambda low, high: high), \
+             patch('time.sleep') as mock_sleep:
+            mock_scrape.invoke.side_effect = [
+                json.dumps({"success": False, "error": "Timeout"}),
+                json.dumps({"success": False, "error": "429 Too Many Requests"}),
+                json.dumps({"success": False, "error": "429 Too Many Requests"}),
+                json.dumps({"success": True, "profile_data": sample_profile_data})
+            ]
+            
+            result = agent._scrape_linkedin_profile("https://linkedin.com/in/johndoe", config)
+        
+        assert result["success"] is True
+        # Upper bounds: 2*2^0, (2*1)*2^1, (2*2)*2^2
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4, 16]
+        assert agent._consecutive_429s == 0
+    
     def test_merge_enrichment_data(self, agent, sample_candidates, sample_profile_data):
         """Test merging of enrichment data with existing candidate data."""
         candidate = sample_candidates[0]
@@ -248,6 +416,295 @@ class TestProfileScrapingAgent:
         # Check enrichment metadata
         assert enriched["enrichment_source"] == "live_scrape"
     
+    def test_merge_enrichment_data_in_place(self, agent, sample_candidates, sample_profile_data):
+        """Test that copy=False merges into the caller's dict and keeps skill order."""
+        candidate = sample_candidates[0]
+        candidate["enrichment_error"] = "Timeout"
+        
+        enriched = agent._merge_enrichment_data(candidate, sample_profile_data, copy=False)
+        
+        assert enriched is candidate
+        assert "enrichment_error" not in enriched
+        assert enriched["skills"] == ["Python", "AWS", "Docker", "Kubernetes"]
+        assert enriched["profile_summary"] == sample_profile_data["summary"]
+    
+    def test_scrape_returns_profile_data_record(self, agent, sample_profile_data):
+        """Test that scrape payloads are parsed into slotted ProfileData records."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = json.dumps({
+                "success": True,
+                "profile_data": {**sample_profile_data, "unused_field": "ignored"}
+            })
+            
+            result = agent._scrape_linkedin_profile("https://linkedin.com/in/johndoe", agent.config)
+        
+        profile = result["profile_data"]
+        assert isinstance(profile, ProfileData)
+        assert not hasattr(profile, "__dict__")
+        assert profile.skills == sample_profile_data["skills"]
+        assert profile.to_dict() == sample_profile_data
+    
+    def test_scrape_accepts_dict_tool_result(self, agent, sample_profile_data):
+        """Test that an already-parsed dict response (e.g. from a mocked tool) is used as-is."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('sub_agents.profile_scraping_agent._json_loads') as mock_loads:
+            mock_scrape.invoke.return_value = {"success": True, "profile_data": sample_profile_data}
+            
+            result = agent._scrape_linkedin_profile("https://linkedin.com/in/johndoe", agent.config)
+        
+        mock_loads.assert_not_called()
+        assert result["profile_data"].to_dict() == sample_profile_data
+    
+    def test_profile_tool_returns_json_string(self):
+        """Test that the scrape tool returns its response as a JSON string, like the other tools."""
+        result = LinkedIn_profile_scrape.invoke({"profile_url": "not-a-profile"})
+        
+        assert isinstance(result, str)
+        result_data = json.loads(result)
+        assert result_data["success"] is False
+        assert result_data["scrape_metadata"]["profile_url"] == "not-a-profile"
+    
+    def test_scrape_parses_json_tool_result(self, agent, sample_profile_data):
+        """Test that the tool's JSON string response is parsed once."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('sub_agents.profile_scraping_agent._json_loads',
+                   wraps=profile_scraping_agent._json_loads) as mock_loads:
+            mock_scrape.invoke.return_value = json.dumps({"success": True, "profile_data": sample_profile_data})
+            
+            result = agent._scrape_linkedin_profile("https://linkedin.com/in/johndoe", agent.config)
+        
+        mock_loads.assert_called_once()
+        assert result["profile_data"].to_dict() == sample_profile_data
+    
+    def test_serialize_response(self, agent, sourcing_manager_request, sample_profile_data):
+        """Test that enrichment responses serialize to JSON bytes."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = {"success": True, "profile_data": sample_profile_data}
+            
+            result = agent.enrich_candidates(sourcing_manager_request)
+        
+        payload = agent.serialize_response(result)
+        
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == result
+    
+    def test_batch_shares_one_timestamp(self, agent, sourcing_manager_request, sample_profile_data):
+        """Test that every record and the response carry the same batch timestamp."""
+        sourcing_manager_request["candidates"].append({"naam": "No URL"})
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape:
+            mock_scrape.invoke.return_value = {"success": True, "profile_data": sample_profile_data}
+            
+            result = agent.enrich_candidates(sourcing_manager_request)
+        
+        records = result["enriched_candidates"] + result["failed_enrichments"]
+        assert len(records) == 3
+        assert {record["enrichment_timestamp"] for record in records} == {result["enrichment_timestamp"]}
+    
+    def test_company_context_from_description(self, agent):
+        """Test keyword-based company context, including rule priority within a group."""
+        context = agent._extract_company_context_from_description(
+            "Built the B2B SaaS platform at a fintech startup with global ambitions", "Acme"
+        )
+        
+        # "startup" outranks "global" and "fintech" outranks "saas"/"tech"
+        assert context["company_size"] == "Startup"
+        assert context["company_stage"] == "Early"
+        assert context["industry"] == "Financial Services"
+        assert context["company_type"] == "B2B"
+        assert context["inferred_from_description"] is True
+        
+        empty = agent._extract_company_context_from_description("Wrote reports", "Acme")
+        assert empty["industry"] is None
+        assert empty["inferred_from_description"] is False
+    
+    def test_company_context_is_memoized(self, agent):
+        """Test that repeated long descriptions are served from the memo and stay mutable."""
+        description = "Senior engineer at a multinational healthcare enterprise, B2C products"
+        
+        first = agent._extract_company_context_from_description(description, "Acme")
+        first["industry"] = "Changed by caller"
+        hits_before = _cached_company_context.cache_info().hits
+        
+        second = agent._extract_company_context_from_description(description, "Acme")
+        
+        assert _cached_company_context.cache_info().hits == hits_before + 1
+        assert second["industry"] == "Healthcare/Biotech"
+        assert second["company_size"] == "Large"
+        assert second["company_type"] == "B2C"
+    
+    def test_calculate_durations_for_work_history(self, agent):
+        """Test vectorized durations, including scalar fallbacks for non-ISO values."""
+        work_experience = [
+            {"start_date": "2019-03-01", "end_date": "2021-11-15T00:00:00Z"},
+            {"start_date": "2021-12-01", "end_date": datetime(2022, 6, 1)},
+            {"start_date": "2022-07-01", "current": True},
+            {"start_date": "2018-01-01"},
+            {"start_date": None, "end_date": "2019-01-01"},
+            {"start_date": "2021-01-01", "end_date": "2020-01-01"},
+        ]
+        
+        durations = agent._calculate_durations(work_experience)
+        
+        assert durations == [
+            agent._calculate_duration(p.get("start_date"), p.get("end_date"), p.get("current", False))
+            for p in work_experience
+        ]
+        assert durations[0] == 32
+        assert durations[1] == 6
+        assert durations[3:] == [0, 0, 0]
+    
+    def test_duration_accepts_month_precision_dates(self, agent):
+        """Test the YYYY-MM fast path and the fromisoformat fallback for other formats."""
+        assert agent._calculate_duration("2020-06", "2021-01", False) == 7
+        assert agent._calculate_duration("2020-06-15", "2021-01-01T09:30:00+02:00", False) == 7
+        assert agent._calculate_duration("2020-13", "2021-01", False) == 0
+        assert agent._calculate_durations([{"start_date": "2020-06", "end_date": "2020-09"}]) == [3]
+        
+        career = agent.analyze_career_progression([
+            {"start_date": "2018-01", "end_date": "2019-01"},
+            {"start_date": "2019-02", "end_date": "2021-07"},
+        ])
+        assert career["career_span_years"] == 3.5
+    
+    def test_merged_skills_are_interned(self, agent, sample_candidates, sample_profile_data):
+        """Test that merged skill names are shared across candidates."""
+        # Build equal but distinct string objects, as JSON decoding would
+        profile = {**sample_profile_data, "skills": ["".join(["Dock", "er"])]}
+        other_profile = {**sample_profile_data, "skills": ["".join(["Do", "cker"])]}
+        
+        first = agent._merge_enrichment_data(sample_candidates[0], profile)
+        second = agent._merge_enrichment_data(sample_candidates[1], other_profile)
+        
+        assert first["skills"] == ["Python", "AWS", "Docker"]
+        assert first["skills"][-1] is second["skills"][-1]
+    
+    def test_owned_candidates_updated_in_place(self, agent, sample_candidates, sample_profile_data):
+        """Test that copy_candidates=False updates successful and failed candidates in place."""
+        request = {
+            "candidates": sample_candidates,
+            "projectid": "PROJ-001",
+            "enrichment_config": {"copy_candidates": False}
+        }
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep'):
+            mock_scrape.invoke.side_effect = lambda args: json.dumps(
+                {"success": True, "profile_data": sample_profile_data}
+                if args["linkedin_url"].endswith("johndoe")
+                else {"success": False, "error": "Profile not found"}
+            )
+            
+            result = agent.enrich_candidates(request)
+        
+        assert result["enriched_candidates"][0] is sample_candidates[0]
+        assert result["failed_enrichments"][0] is sample_candidates[1]
+        assert sample_candidates[1]["enrichment_error"] == "Profile not found"
+    
+    def test_deep_analyses_run_once_per_merge(self, agent, sample_candidates, sample_profile_data):
+        """Test that the profile summary reuses the analyses computed for the merge."""
+        with patch.object(agent, 'analyze_career_progression', wraps=agent.analyze_career_progression) as career, \
+             patch.object(agent, 'extract_achievements_and_impact', wraps=agent.extract_achievements_and_impact) as achievements, \
+             patch.object(agent, 'analyze_skill_evolution', wraps=agent.analyze_skill_evolution) as skills:
+            enriched = agent._merge_enrichment_data(sample_candidates[0], sample_profile_data)
+        
+        assert career.call_count == achievements.call_count == skills.call_count == 1
+        assert enriched["deep_profile_summary"]["profile_score"] > 0
+        # Strengths added by the summary must not leak into the career analysis
+        assert (enriched["deep_profile_summary"]["unique_strengths"]
+                is not enriched["career_analysis"]["career_insights"])
+    
+    def test_deep_analysis_cached_for_unchanged_history(self, agent, sample_candidates, sample_profile_data):
+        """Test that re-merging an unchanged profile reuses its analysis without sharing objects."""
+        first = agent._merge_enrichment_data(sample_candidates[0], sample_profile_data)
+        
+        with patch.object(agent, 'analyze_career_progression') as career:
+            second = agent._merge_enrichment_data(sample_candidates[0], sample_profile_data)
+        
+        career.assert_not_called()
+        for key in ("career_analysis", "achievements", "skill_analysis", "deep_profile_summary"):
+            assert second[key] == first[key]
+        
+        # Changing one candidate's analysis must not reach the cache or other candidates
+        second["deep_profile_summary"]["unique_strengths"].append("Edited downstream")
+        third = agent._merge_enrichment_data(sample_candidates[0], sample_profile_data)
+        assert third["deep_profile_summary"] == first["deep_profile_summary"]
+        assert "Edited downstream" not in first["deep_profile_summary"]["unique_strengths"]
+        
+        # A different work history is analysed afresh
+        changed = {**sample_profile_data, "work_experience": [
+            {**sample_profile_data["work_experience"][0], "description": "Led the platform team"}
+        ]}
+        with patch.object(agent, 'analyze_career_progression', wraps=agent.analyze_career_progression) as career:
+            agent._merge_enrichment_data(sample_candidates[0], changed)
+        
+        career.assert_called_once()
+    
+    def test_career_keywords_match_whole_words(self, agent):
+        """Test that stage, industry and title keywords only match whole words or phrases."""
+        career = agent.analyze_career_progression([
+            {"title": "Team Leader", "description": "Biotech research on medical devices at a Series A company"},
+            {"title": "Lead Engineer", "description": "Wrote articles in a series about maintaining software"},
+        ])
+        
+        assert career["company_tier_progression"] == ["STARTUP", "UNKNOWN"]
+        # "biotech" no longer counts as technology, so the first role is healthcare only
+        assert career["industry_focus"] == "DIVERSE"
+        assert career["growth_trajectory"] == "UPWARD"
+    
+    def test_matching_categories_keeps_substring_semantics(self):
+        """Test that the single-pass category match finds keywords inside and overlapping others."""
+        categories = _substring_categories((
+            ("SHORT", ("mark",)),
+            ("LONG", ("market",)),
+            ("INNER", ("ark", "zzz")),
+        ))
+        
+        assert _matching_categories("trademarket", categories) == {"SHORT", "LONG", "INNER"}
+        assert _matching_categories("bookmark", categories) == {"SHORT", "INNER"}
+        assert _matching_categories("dark", categories) == {"INNER"}
+        assert _matching_categories("nothing here", categories) == set()
+    
+    def test_quantified_achievements_are_strings(self, agent):
+        """Test that quantified achievements are the matched text, deduplicated."""
+        achievements = agent.extract_achievements_and_impact([{
+            "title": "Engineering Manager",
+            "company": "Acme",
+            "description": "Grew revenue 25% and led 12 people; another 25% cut in costs, $3M budget"
+        }])
+        
+        assert achievements[0]["quantified_achievements"] == ["25%", "12 people", "$3M"]
+    
+    def test_quantified_achievements_long_digit_runs(self, agent):
+        """Test that long digit runs are matched from the start of the run, never from inside it."""
+        run = "7" * 20000
+        achievements = agent.extract_achievements_and_impact([
+            {"title": "Engineer", "description": f"Ticket {run} closed; grew usage 40%"},
+            {"title": "Engineer", "description": f"Served {run} users, {run}x faster"},
+        ])
+        
+        assert achievements[0]["quantified_achievements"] == ["40%"]
+        assert achievements[1]["quantified_achievements"] == [f"{run} users"]
+    
+    def test_descriptions_lowercased_once_per_merge(self, agent, sample_candidates, sample_profile_data):
+        """Test that every keyword pass shares one lowercased copy of the descriptions."""
+        with patch('sub_agents.profile_scraping_agent._lowered_descriptions',
+                   wraps=profile_scraping_agent._lowered_descriptions) as lowered:
+            enriched = agent._merge_enrichment_data(sample_candidates[0], sample_profile_data)
+        
+        assert lowered.call_count == 1
+        assert len(enriched["company_history"]) == len(sample_profile_data["work_experience"])
+    
+    def test_deep_summary_lowercases_descriptions_once(self, agent, sample_profile_data):
+        """Test that the analyses run by the deep summary share one lowercased copy of the descriptions."""
+        candidate = {"work_experience": sample_profile_data["work_experience"], "skills": ["Python"]}
+        with patch('sub_agents.profile_scraping_agent._lowered_descriptions',
+                   wraps=profile_scraping_agent._lowered_descriptions) as lowered:
+            summary = agent.generate_deep_profile_summary(candidate)
+        
+        assert lowered.call_count == 1
+        assert summary["career_narrative"]
+    
     def test_batch_processing(self, agent, sample_profile_data):
         """Test batch processing of candidates."""
         # Create more candidates than batch size
@@ -280,6 +737,71 @@ class TestProfileScrapingAgent:
             assert result["enrichment_stats"]["total_processed"] == 25
             assert mock_scrape.invoke.call_count == 25
     
+    def test_scrapes_run_concurrently(self, agent, sourcing_manager_request, sample_profile_data):
+        """Test that profiles in a batch are scraped on parallel worker threads."""
+        # Both scrapes must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def scrape(_):
+            barrier.wait()
+            return json.dumps({"success": True, "profile_data": sample_profile_data})
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep'):
+            mock_scrape.invoke.side_effect = scrape
+            
+            result = agent.enrich_candidates(sourcing_manager_request)
+            
+            assert result["enrichment_stats"]["success_count"] == 2
+    
+    async def test_enrich_candidates_stream(self, agent, sourcing_manager_request, sample_profile_data):
+        """Test that enriched candidates are streamed, followed by a stats record."""
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep'):
+            mock_scrape.invoke.side_effect = [
+                json.dumps({"success": True, "profile_data": sample_profile_data}),
+                json.dumps({"success": False, "error": "Profile not found"}),
+            ] + [json.dumps({"success": False, "error": "Profile not found"})] * 2
+            
+            records = [record async for record in agent.enrich_candidates_stream(sourcing_manager_request)]
+        
+        summary = records[-1]
+        assert summary["stream_complete"] is True
+        assert summary["enrichment_stats"]["total_processed"] == 2
+        assert summary["enrichment_stats"]["success_count"] == 1
+        assert summary["enrichment_stats"]["failed_count"] == 1
+        assert sorted(r["enrichment_status"] for r in records[:-1]) == ["failed", "success"]
+    
+    async def test_enrich_candidates_async_with_rate_cap(self, agent, sourcing_manager_request, sample_profile_data):
+        """Test that the async path bursts up to rate_limit_rps instead of sleeping per request."""
+        sourcing_manager_request["enrichment_config"] = {"rate_limit_rps": 10}
+        
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.sleep') as mock_sleep:
+            mock_scrape.invoke.return_value = json.dumps({
+                "success": True,
+                "profile_data": sample_profile_data
+            })
+            
+            result = await agent.enrich_candidates_async(sourcing_manager_request)
+        
+        assert result["success"] is True
+        assert result["enrichment_stats"]["success_count"] == 2
+        assert mock_sleep.call_count == 0
+    
+    def test_token_bucket_spaces_requests_past_burst(self):
+        """Test that the token bucket only waits once the burst is spent."""
+        limiter = _TokenBucket(rate=2)
+        
+        with patch('time.monotonic', return_value=limiter._updated), \
+             patch('time.sleep') as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+            assert mock_sleep.call_count == 0
+            
+            limiter.acquire()
+            mock_sleep.assert_called_once_with(0.5)
+    
     def test_custom_config_override(self, agent, sourcing_manager_request, sample_profile_data):
         """Test that custom config overrides default config."""
         sourcing_manager_request["enrichment_config"] = {
@@ -328,6 +850,56 @@ class TestProfileScrapingAgent:
             assert all("error" in f["enrichment_error"].lower() 
                       for f in result["failed_enrichments"])
     
+    def test_database_agent_built_once(self, agent, sample_candidates):
+        """Test that the DatabaseAgent is created lazily and reused across updates."""
+        with patch('sub_agents.profile_scraping_agent.DatabaseAgent') as mock_db_agent_cls, \
+             patch('sub_agents.profile_scraping_agent.DatabaseAgentState'):
+            mock_db_agent_cls.return_value.update_prospects.return_value = 2
+            
+            assert agent._update_prospects_in_database(sample_candidates) == 2
+            assert agent._update_prospects_in_database(sample_candidates) == 2
+            
+            mock_db_agent_cls.assert_called_once()
+    
+    def test_prospect_updates_sent_in_one_call(self, agent, sample_candidates):
+        """Test that all enriched candidates are handed to the DatabaseAgent in one call, keyed by stored URL."""
+        with patch('sub_agents.profile_scraping_agent.DatabaseAgent') as mock_db_agent_cls, \
+             patch('sub_agents.profile_scraping_agent.DatabaseAgentState'):
+            db_agent = mock_db_agent_cls.return_value
+            db_agent.update_prospects.return_value = 2
+            
+            stored_as = {"full_name": "Jo", "linkedin_url": "https://www.LinkedIn.com/in/Jo/"}
+            agent._update_prospects_in_database([*sample_candidates, stored_as, {"full_name": "No URL"}])
+            
+            db_agent.update_prospects.assert_called_once()
+            db_agent.update_prospect.assert_not_called()
+            updates_by_url = db_agent.update_prospects.call_args.args[0]
+            # Prospects are stored under their raw URL, so updates must use it unchanged
+            assert set(updates_by_url) == {c["linkedin_url"] for c in [*sample_candidates, stored_as]}
+            assert updates_by_url["https://linkedin.com/in/johndoe"]["skills"] == ["Python", "AWS"]
+
+    def test_prospect_updates_follow_input_order(self, agent, sample_candidates, sample_profile_data):
+        """Test that failed and successful prospects are written in input order."""
+        request = {
+            "candidates": sample_candidates,
+            "projectid": "PROJ-001",
+            "enrichment_config": {"rate_limit_delay": 0, "max_retries": 1}
+        }
+        not_found = json.dumps({"success": False, "error": "Profile not found"})
+        found = json.dumps({"success": True, "profile_data": sample_profile_data})
+
+        with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch.object(agent, '_update_prospects_in_database', return_value=2) as mock_update:
+            # John Doe (first in the input) fails, Jane Smith succeeds
+            mock_scrape.invoke.side_effect = lambda args: (
+                not_found if args["linkedin_url"].endswith("johndoe") else found
+            )
+
+            agent.enrich_candidates(request)
+
+            written = mock_update.call_args.args[0]
+            assert [c["full_name"] for c in written] == ["John Doe", "Jane Smith"]
+
     def test_rate_limiting(self, agent, sample_candidates, sample_profile_data):
         """Test that rate limiting is applied between requests."""
         request = {
@@ -336,7 +908,9 @@ class TestProfileScrapingAgent:
             "enrichment_config": {"rate_limit_delay": 0.5}
         }
         
+        # Scrapes take no time on a stopped clock, so every wait is a whole number of slots
         with patch('sub_agents.profile_scraping_agent.LinkedIn_profile_scrape') as mock_scrape, \
+             patch('time.monotonic', return_value=100.0), \
              patch('time.sleep') as mock_sleep:
             
             mock_scrape.invoke.return_value = json.dumps({
@@ -346,8 +920,30 @@ class TestProfileScrapingAgent:
             
             agent.enrich_candidates(request)
             
-            # Check that sleep was called for rate limiting
-            assert mock_sleep.call_count >= len(sample_candidates)
+            # The first request goes out immediately; each later one waits one more slot
+            waits = sorted(call.args[0] for call in mock_sleep.call_args_list)
+            assert waits == [0.5 * slot for slot in range(1, len(sample_candidates))]
+    
+    def test_token_bucket_spaces_acquires_by_delay(self):
+        """Test that consecutive acquires are released exactly rate_limit_delay apart."""
+        delay = 0.5
+        clock = [100.0]
+        
+        def fake_sleep(seconds):
+            clock[0] += seconds
+        
+        with patch('time.monotonic', side_effect=lambda: clock[0]), \
+             patch('time.sleep', side_effect=fake_sleep):
+            # As built by _get_rate_limiter for rate_limit_delay
+            bucket = _TokenBucket(1 / delay, 1.0)
+            released = []
+            for _ in range(5):
+                bucket.acquire()
+                released.append(clock[0])
+        
+        spacing = [later - earlier for earlier, later in zip(released, released[1:])]
+        assert spacing == pytest.approx([delay] * 4)
+        assert released[0] == 100.0
 
 
 class TestProfileScrapingAgentIntegration: